@@ -0,0 +1,49 @@
+"""
+GitStory command line interface.
+
+Each subcommand lives in its own module and is only imported when it is
+invoked (or listed by --help), so running one command never pays for
+loading the others.
+"""
+
+import importlib
+
+import click
+
+
+class LazyGroup(click.Group):
+    """Click group that resolves subcommands from "module:attribute" paths on demand."""
+
+    def __init__(self, *args, lazy_subcommands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands:
+            return self._load_command(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load_command(self, cmd_name):
+        module_name, attr = self.lazy_subcommands[cmd_name].rsplit(":", 1)
+        return getattr(importlib.import_module(module_name), attr)
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "compare": "gitstory.cli.compare:compare",
+        "dashboard": "gitstory.cli.dashboard:dashboard",
+        "key": "gitstory.cli.key:key",
+        "run": "gitstory.cli.run:run",
+        "since": "gitstory.cli.since:since",
+    },
+)
+def cli():
+    click.echo()
+    click.echo("Welcome to GitStory: Turning git repos into readable stories\n")
+
+
+__all__ = ["LazyGroup", "cli"]
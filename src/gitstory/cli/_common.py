@@ -0,0 +1,67 @@
+"""Helpers shared by the CLI command modules."""
+
+from pathlib import Path
+
+import click
+
+# Root of the installed gitstory package, resolved once per process
+PACKAGE_DIR = Path(__file__).resolve().parent.parent
+KEY_PATH = PACKAGE_DIR / "data" / "key.txt"
+
+# Rule printed above and below a summary in the terminal
+SEPARATOR = "=" * 60
+
+# (substrings, hint lines) checked in order against the lowercased error text
+_ERROR_TABLE = (
+    (
+        ("empty", "no candidates"),
+        (
+            "💡 The AI returned an empty response after 3 attempts.",
+            "   This might be temporary. Please try again in a few moments.",
+        ),
+    ),
+    (
+        ("incomplete", "end marker"),
+        (
+            "💡 The AI response was incomplete after 3 attempts.",
+            "   This might be due to:",
+            "   - Network interruption",
+            "   - API timeout",
+            "   Please try again.",
+        ),
+    ),
+    (
+        ("rate limit",),
+        ("💡 API rate limit exceeded. Please wait a few minutes and try again.",),
+    ),
+)
+
+
+def report_error(error_msg: str) -> None:
+    """Print an actionable hint for a summarization error to stderr."""
+    lowered = error_msg.lower()
+    hint = next(
+        (
+            lines
+            for substrings, lines in _ERROR_TABLE
+            if any(substring in lowered for substring in substrings)
+        ),
+        None,
+    )
+    # One write instead of one flush per line
+    click.echo("\n".join(hint or (f"   Details: {error_msg}",)), err=True)
+
+
+def report_key_error(error: Exception) -> None:
+    """Print why the API key could not be loaded, and how to set it, to stderr."""
+    click.echo(
+        f"❌ Error: {error}\n\n"
+        "This is most likely to your key being set wrong!\n"
+        'Please set your API key: gitstory key --key="your_key"',
+        err=True,
+    )
+
+
+def echo_summary(summary: str) -> None:
+    """Print a finished summary between separator rules in a single write."""
+    click.echo(f"\n{SEPARATOR}\n{summary}\n{SEPARATOR}\n\n")
@@ -0,0 +1,103 @@
+"""CLI command that compares two branches and summarizes the difference."""
+
+import click
+import sys
+
+from gitstory.cli._common import PACKAGE_DIR, echo_summary, report_key_error
+
+
+@click.command(
+    "compare",
+    short_help="Compares two branches in repository and generates summary & branch differences",
+)
+@click.argument("repo_path", type=click.Path(exists=True))
+@click.argument("base_branch")
+@click.argument("compare_branch")
+@click.option("--since", default=None, help="Start time (ISO or relative like '2w')")
+@click.option("--until", default=None, help="End time (ISO or relative)")
+@click.option(
+    "--context", default=5, type=int, help="Number of context commits from merge base"
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Always call Gemini, even if a cached summary exists",
+)
+def compare(repo_path, base_branch, compare_branch, since, until, context, no_cache):
+    """Compares two branches based on the current local repo copy.
+
+    TIME_PERIOD supports: 4w (weeks), 6d (days), 8m (months), 9y (years) , OR yyyy-mm-dd format for
+    --until flag or --since command
+
+    Examples:
+        gitstory compare . main feature --since=2w    # Compares from the last 2 weeks
+        gitstory compare . main feature --until=4w    # Until the 4th last week
+    """
+    try:
+        from gitstory.gemini_ai import AISummarizer
+        from gitstory.parser import RepoParser
+        from gitstory.read_key.read_key import read_key
+
+        # Step 1: Load API key
+        try:
+            api_key = read_key(str(PACKAGE_DIR))
+        except Exception as ex:
+            report_key_error(ex)
+            sys.exit(1)
+        click.echo("🔑 API key configured & loaded...")
+
+        # Step 2: Compare branches
+        click.echo("🔍 Comparing branches...")
+        parser = RepoParser(repo_path)
+        comparison_data = parser.compare(
+            base_branch=base_branch,
+            compare_branch=compare_branch,
+            since=since,
+            until=until,
+            context_commits=context,
+        )
+
+        click.echo(
+            f"   Base: {comparison_data['base_branch']} ({comparison_data['divergence_metrics']['base_commit_count']} commits)"
+        )
+        click.echo(
+            f"   Compare: {comparison_data['compare_branch']} ({comparison_data['divergence_metrics']['compare_commit_count']} commits)"
+        )
+        click.echo(
+            f"   Diverged: {comparison_data['divergence_metrics']['time_since_divergence']}"
+        )
+
+        # Step 3: Generate AI comparison summary
+        click.echo("🤖 Generating AI comparison summary...")
+        summarizer = AISummarizer(
+            api_key=api_key, use_cache=False if no_cache else None
+        )
+        result = summarizer.summarize_comparison(comparison_data)
+
+        # Step 4: Handle errors
+        if result.get("error"):
+            click.echo("❌ Error generating comparison summary", err=True)
+            click.echo(f"   Details: {result['error']}", err=True)
+            sys.exit(1)
+
+        # Step 5: Display results
+        click.echo("✅ Comparison summary complete!")
+        echo_summary(result["summary"])
+
+        return "Comparison complete!"
+
+    except ValueError as e:
+        click.echo("❌ Error comparing branches", err=True)
+        if "not found" in str(e).lower():
+            click.echo(
+                "💡 Tip: Run 'git branch -a' to see available branches", err=True
+            )
+        click.echo(f"Error: {e}")
+        click.echo()
+        sys.exit(1)
+    except Exception as e:
+        click.echo("❌ Error comparing branches", err=True)
+        click.echo(f"Error: {e}")
+        click.echo()
+        sys.exit(1)
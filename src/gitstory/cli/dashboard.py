@@ -0,0 +1,108 @@
+"""CLI command that renders the repository summary as an HTML dashboard."""
+
+import click
+import sys
+
+from gitstory.cli._common import PACKAGE_DIR, report_error, report_key_error
+
+
+@click.command("dashboard", short_help="Generates downloadable report about repo")
+@click.argument("repo_path", type=click.Path(exists=True))
+@click.option("--branch", default=None, help="Branch name (defaults to current branch)")
+@click.option("--since", default=None, help="Start time (ISO or relative like '2w')")
+@click.option("--until", default=None, help="End time (ISO or relative like '2w')")
+@click.option(
+    "--validation-fallback",
+    is_flag=True,
+    default=False,
+    help="If set, parser will attempt best-effort fallbacks on validation failures",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Always call Gemini, even if a cached summary exists",
+)
+def dashboard(repo_path, branch, since, until, validation_fallback, no_cache):
+    """Generate Visual Dashboard (dashboard.html) based on current local repo copy (will
+    place dashboard.html in an output directory, located at the root of the repo passed in).
+
+    TIME_PERIOD supports: 4w (weeks), 6d (days), 8m (months), 9y (years), OR yyyy-mm-dd format for
+    --until or --since flags
+
+    Examples:
+        gitstory dashboard ./ --since=2w              # Generates summary based on the last 2 weeks on current branch
+        gitstory dashboard ./ --until=2w              # Generates summary until the last 2 weeks on current branch
+        gitstory dashboard ./ --branch=feature        # Generating summary on the feature branch
+    """
+    try:
+        from gitstory.gemini_ai import AISummarizer
+        from gitstory.parser import RepoParser
+        from gitstory.parser.validation import ValidationError
+        from gitstory.read_key.read_key import read_key
+
+        # Step 1: Load configuration & validate API key
+        try:
+            api_key = read_key(str(PACKAGE_DIR))
+        except Exception as ex:
+            report_key_error(ex)
+            sys.exit(1)
+        click.echo("🔑 API key configured & loaded...")
+
+        # Step 2: Parse repository
+        click.echo("🔍 Analyzing repository...")
+        parser = RepoParser(
+            repo_path,
+            on_validation_error=("fallback" if validation_fallback else "raise"),
+        )
+        try:
+            parsed_data = parser.parse(branch=branch, since=since, until=until)
+        except Exception as e:
+            # If it's a ValidationError, surface the report; otherwise re-raise
+            if isinstance(e, ValidationError):
+                click.echo("❌ Error: Data validation failed", err=True)
+                stage = getattr(e, "stage", None)
+                if stage:
+                    click.echo(f"   Stage: {stage}", err=True)
+                click.echo(f"   {str(e)}", err=True)
+                report = getattr(e, "report", None)
+                if report:
+                    skipped = report.get("skipped_commits", 0)
+                    click.echo(f"   Skipped commits: {skipped}", err=True)
+                sys.exit(1)
+            raise
+
+        # Step 3: Generate AI summary
+        click.echo("🤖 Generating AI summary in Visualization Dashboard...")
+        summarizer = AISummarizer(
+            api_key=api_key, use_cache=False if no_cache else None
+        )
+        result = summarizer.summarize(parsed_data, output_format="dashboard")
+
+        # Check for errors before generating dashboard
+        if result.get("error"):
+            click.echo("❌ Error generating summary", err=True)
+            # Provide specific, actionable error messages
+            report_error(result["error"])
+
+            click.echo()
+            sys.exit(1)
+
+        # Step 4: Display results on Visualization Dashboard
+        from gitstory.visual_dashboard.dashboard_generator import generate_dashboard
+
+        generate_dashboard(
+            repo_data=parsed_data,
+            ai_summary=result,
+            output_file="dashboard.html",
+            repo_path=repo_path,
+        )
+        click.echo("✅ Dashboard saved!")
+        click.echo()
+        return "Dashboard saved!"
+
+    except Exception as e:
+        click.echo("❌ Error generating dashboard", err=True)
+        click.echo(f"Error: {e}")
+        click.echo()
+        sys.exit(1)
@@ -0,0 +1,17 @@
+"""CLI command that stores the Gemini API key."""
+
+import click
+
+from gitstory.cli._common import KEY_PATH
+
+
+@click.command("key", short_help="Sets Gemini API key internally to key passed in")
+@click.option("--key", help="Enter your Gemini API key")
+def key(key):
+    """Configures Gemini API key into GitStory.
+    Example:
+        gitstory key --key="<your-key"
+    """
+    KEY_PATH.parent.mkdir(parents=True, exist_ok=True)
+    KEY_PATH.write_text(key)
+    click.echo(f"Key written to {KEY_PATH}!")
@@ -0,0 +1,151 @@
+"""CLI command that summarizes a repository in the terminal."""
+
+import click
+import sys
+
+from gitstory.cli._common import (
+    PACKAGE_DIR,
+    SEPARATOR,
+    echo_summary,
+    report_error,
+    report_key_error,
+)
+
+
+@click.command("run", short_help="Generates a summary based on current code repo")
+@click.argument("repo_path", type=click.Path(exists=True))
+@click.option("--branch", default=None, help="Branch name (defaults to current branch)")
+@click.option("--since", default=None, help="Start time (ISO or relative like '2w')")
+@click.option("--until", default=None, help="End time (ISO or relative like '2w')")
+@click.option(
+    "--validation-fallback",
+    is_flag=True,
+    default=False,
+    help="If set, parser will attempt best-effort fallbacks on validation failures",
+)
+@click.option(
+    "--stream",
+    is_flag=True,
+    default=False,
+    help="Print the summary as it is generated instead of waiting for all of it",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Always call Gemini, even if a cached summary exists",
+)
+def run(repo_path, branch, since, until, validation_fallback, stream, no_cache):
+    """Generate repository summary based on current local repo copy.
+
+    TIME_PERIOD supports: 4w (weeks), 6d (days), 8m (months), 9y (years), OR yyyy-mm-dd format for
+    --until or --since flags
+
+    Examples:
+        gitstory run ./ --since=2w              # Generates summary based on the last 2 weeks on current branch
+        gitstory run ./ --until=2w              # Generates summary until the last 2 weeks on current branch
+        gitstory run ./ --branch=feature        # Generating summary on the feature branch
+        gitstory run ./ --stream                # Prints the summary while it is generated
+    """
+    try:
+        from gitstory.gemini_ai import AISummarizer
+        from gitstory.parser import RepoParser
+        from gitstory.parser.validation import ValidationError
+        from gitstory.read_key.read_key import read_key
+
+        try:
+            api_key = read_key(str(PACKAGE_DIR))
+        except Exception as ex:
+            report_key_error(ex)
+            sys.exit(1)
+        click.echo("🔑 API key configured & loaded...")
+
+        # Step 2: Parse repo
+        click.echo("🔍 Analyzing repository...")
+        try:
+            parser = RepoParser(
+                repo_path,
+                on_validation_error=("fallback" if validation_fallback else "raise"),
+            )
+            parsed_data = parser.parse(since=since, until=until, branch=branch)
+
+            # Log validation warnings if any
+            if (
+                "metadata" in parsed_data
+                and "validation_report" in parsed_data["metadata"]
+            ):
+                report = parsed_data["metadata"]["validation_report"]
+                if report["skipped_commits"] > 0:
+                    click.echo(
+                        f"⚠️  Skipped {report['skipped_commits']} invalid commits during parsing",
+                        err=False,
+                    )
+                for warning in report["warnings"][:3]:  # Show first 3 warnings
+                    click.echo(f"   {warning}", err=False)
+                if len(report["warnings"]) > 3:
+                    click.echo(
+                        f"   ... and {len(report['warnings']) - 3} more warnings",
+                        err=False,
+                    )
+        except ValidationError as ve:
+            click.echo("❌ Error: Data validation failed", err=True)
+            # Show stage if available
+            stage = getattr(ve, "stage", None)
+            if stage:
+                click.echo(f"   Stage: {stage}", err=True)
+            click.echo(f"   {str(ve)}", err=True)
+            # If a validation report was attached, show a short summary
+            report = getattr(ve, "report", None)
+            if report:
+                try:
+                    skipped = report.get("skipped_commits", 0)
+                    warnings = report.get("warnings", [])
+                    click.echo(f"   Skipped commits: {skipped}", err=True)
+                    for w in warnings[:3]:
+                        click.echo(f"     - {w}", err=True)
+                    if len(warnings) > 3:
+                        click.echo(
+                            f"     ...and {len(warnings) - 3} more warnings", err=True
+                        )
+                except Exception:
+                    # Best-effort display; do not mask original error
+                    pass
+            click.echo(
+                "   This might indicate corrupted commits in the repository.", err=True
+            )
+            sys.exit(1)
+
+        # Step 3: Summarize
+        click.echo("🤖 Generating AI summary...")
+        summarizer = AISummarizer(
+            api_key=api_key, use_cache=False if no_cache else None
+        )
+        if stream:
+            click.echo("\n" + SEPARATOR)
+            for chunk in summarizer.summarize_stream(parsed_data):
+                click.echo(chunk, nl=False)
+            click.echo()
+            click.echo(SEPARATOR + "\n")
+            click.echo("✅ Summary generation complete!")
+            click.echo()
+            return "Summary generation complete!"
+
+        result = summarizer.summarize(parsed_data)
+
+        # Check for errors before displaying
+        if result.get("error"):
+            # Provide specific, actionable error messages
+            report_error(result["error"])
+            sys.exit(1)
+
+        # Step 4: Display summary in terminal
+        click.echo("✅ Summary generation complete!")
+        echo_summary(result["summary"])
+
+        return "Summary generation complete!"
+
+    except (Exception, SystemExit) as e:
+        click.echo("❌ Error generating summary", err=True)
+        click.echo(f"Error: {e}")
+        click.echo()
+        sys.exit(getattr(e, "code", 1))
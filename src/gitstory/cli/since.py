@@ -0,0 +1,103 @@
+"""CLI command that summarizes a repository from a relative point in time."""
+
+import click
+import sys
+
+from gitstory.cli._common import (
+    PACKAGE_DIR,
+    echo_summary,
+    report_error,
+    report_key_error,
+)
+
+
+@click.command("since", short_help="Generate summary from specified time period")
+@click.argument("repo_path", type=click.Path(exists=True))
+@click.argument("time_period")
+@click.option(
+    "--branch", default=None, help="Branch name (defaults to current branch otherwise)"
+)
+@click.option("--until", default=None, help="End time (ISO or relative like '2w')")
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Always call Gemini, even if a cached summary exists",
+)
+def since(repo_path, time_period, until, branch, no_cache):
+    """Generate repository summary starting from a relative time period based on the current local
+    repo copy.
+
+    TIME_PERIOD supports: 4w (weeks), 6d (days), 8m (months), 9y (years) , OR yyyy-mm-dd format for
+    --until flag or since command
+
+    Examples:
+        gitstory since ./ 2w                # Last 2 weeks on current branch
+        gitstory since ./ 4w --until=2w     # From the 4th last week to the 2nd last week
+        gitstory since ./ 3m --branch=feature  # Last 3 months on feature branch
+    """
+    try:
+        from gitstory.gemini_ai import AISummarizer
+        from gitstory.parser import RepoParser
+        from gitstory.parser.validation import ValidationError
+        from gitstory.read_key.read_key import read_key
+
+        # Step 1: Load API key
+        try:
+            api_key = read_key(str(PACKAGE_DIR))
+        except Exception as ex:
+            report_key_error(ex)
+            sys.exit(1)
+        click.echo("🔑 API key configured & loaded...")
+
+        # Step 2: Parse repo with since parameter
+        click.echo(f"🔍 Analyzing repository from {time_period} ago...")
+        parser = RepoParser(repo_path)
+        try:
+            parsed_data = parser.parse(since=time_period, branch=branch, until=until)
+        except Exception as e:
+            if isinstance(e, ValidationError):
+                click.echo("❌ Error: Data validation failed", err=True)
+                stage = getattr(e, "stage", None)
+                if stage:
+                    click.echo(f"   Stage: {stage}", err=True)
+                click.echo(f"   {str(e)}", err=True)
+                report = getattr(e, "report", None)
+                if report:
+                    skipped = report.get("skipped_commits", 0)
+                    click.echo(f"   Skipped commits: {skipped}", err=True)
+                sys.exit(1)
+            raise
+
+        # Step 3: Summarize
+        click.echo("🤖 Generating AI summary...")
+        summarizer = AISummarizer(
+            api_key=api_key, use_cache=False if no_cache else None
+        )
+        result = summarizer.summarize(parsed_data)
+
+        # Check for errors before displaying
+        if result.get("error"):
+            # Provide specific, actionable error messages
+            report_error(result["error"])
+            sys.exit(1)
+
+        # Step 4: Display summary in terminal
+        click.echo("✅ Summary generation complete!")
+        echo_summary(result["summary"])
+
+        return "Summary generation complete!"
+
+    except ValueError as e:
+        click.echo("❌ Error parsing time period", err=True)
+        click.echo(
+            "💡 Tip: Use formats like '2w' (weeks), '7d' (days), '3m' (months), '1y' (years)",
+            err=True,
+        )
+        click.echo(f"Error: {e}")
+        click.echo()
+        sys.exit(1)
+    except (Exception, SystemExit) as e:
+        click.echo(f"Error: {e}")
+        click.echo()
+        sys.exit(getattr(e, "code", 1))
@@ -7,8 +7,11 @@ Holds all necessary configuration settings for the GitStory CLI.
 
 
 class Config:
-    # Static variable for the API key environment variable name
+    __slots__ = ("api_key", "model")
+
+    # Static variables for the environment variable names
     API_KEY_ENV_VAR = "GITSTORY_API_KEY"
+    MODEL_ENV_VAR = "GITSTORY_LLM_MODEL"
     #DEFAULT_MODEL = "Z.ai GLM-4.5"
     DEFAULT_MODEL = "gemini-2.5-pro"
 
@@ -19,16 +22,16 @@ class Config:
 
     # loads configuration settings from env variables
     @classmethod
-    def load():
-        api_key = os.getenv(Config.API_KEY_ENV_VAR)
+    def load(cls) -> "Config":
+        api_key = os.getenv(cls.API_KEY_ENV_VAR)
 
         if not api_key:
-            print(f"ERROR: The environment variable {api_key} is not set.")
+            print(f"ERROR: The environment variable {cls.API_KEY_ENV_VAR} is not set.")
             print("Please set your LLM API key to proceed.")
             # exits since app cannot function without the key
             sys.exit(1)
 
-        model = os.getenv(Config.DEFAULT_MODEL)
+        model = os.getenv(cls.MODEL_ENV_VAR, cls.DEFAULT_MODEL)
 
         # Return a new Config object with the loaded values
-        return Config(api_key=api_key, model=model)
+        return cls(api_key=api_key, model=model)
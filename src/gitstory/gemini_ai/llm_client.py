@@ -2,10 +2,19 @@
 
 from __future__ import annotations
 
+import json
+import random
 import time
-from typing import Any, Dict
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Iterator, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:  # Optional speed-up for encoding prompts and decoding responses
+    import orjson
+except ImportError:
+    orjson = None
 
 
 # Define exceptions inline since we're in gemini_ai not gitstory
@@ -21,13 +30,40 @@ class SummarizationError(Exception):
     pass
 
 
+def _encode_json(payload: Dict[str, Any]) -> bytes:
+    """Serialize a request body, preferring orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+def _loads_json(data: str | bytes) -> Any:
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _decode_json(response: requests.Response) -> Any:
+    """Parse a response body, preferring orjson when it is installed."""
+    if orjson is None:
+        return response.json()
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as error:
+        # Match response.json() so callers keep treating this as a request error
+        raise requests.exceptions.InvalidJSONError(str(error), response=response)
+
+
 class LLMClient:
     """Handles outbound requests to the Google Gemini API."""
 
     BASE_URL = "https://generativelanguage.googleapis.com/v1beta/models"
     MAX_RETRIES = 3
-    RETRY_DELAY_SECONDS = 60
-    TIMEOUT_RETRY_DELAY_SECONDS = 5
+    # Exponential backoff: min(cap, base * 2**(attempt - 1)) + uniform(0, jitter)
+    BACKOFF_BASE_SECONDS = 1.0
+    BACKOFF_CAP_SECONDS = 30.0
+    BACKOFF_JITTER_SECONDS = 1.0
+    # Upper bound on server-advised waits (Retry-After / X-RateLimit-Reset / retryDelay)
+    MAX_ADVISED_DELAY_SECONDS = 60.0
+    RETRYABLE_STATUS_CODES = (429, 503)
 
     def __init__(self, api_key: str, model: str = "gemini-2.5-pro") -> None:
         if not api_key:
@@ -35,34 +71,57 @@ class LLMClient:
         self.api_key = api_key
         self.model = model
         self.endpoint = f"{self.BASE_URL}/{model}:generateContent"
+        # Send the key as a header so it never ends up in URLs or proxy logs
+        self._url = self.endpoint
+        self._stream_url = f"{self.BASE_URL}/{model}:streamGenerateContent?alt=sse"
+        self._headers = {
+            "x-goog-api-key": api_key,
+            "Content-Type": "application/json",
+        }
+        # Keep-alive session so retries and follow-up calls reuse the TLS connection
+        self.session = requests.Session()
+        self.session.mount(
+            "https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0)
+        )
+
+    def __enter__(self) -> "LLMClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release pooled connections."""
+        self.session.close()
 
     def generate(self, prompt: str, *, temperature: float = 0.5) -> Dict[str, Any]:
         """Generate content from Gemini, retrying on recoverable failures."""
-        payload = {
-            "contents": [{"parts": [{"text": prompt}]}],
-            "generationConfig": {
-                "temperature": temperature,  # Lower temperature for more factual, consistent output
-                "maxOutputTokens": 4000,  # Increased for dashboard format (800-1200 words)
-            },
-        }
+        # Encode once; retries resend the same bytes
+        body = _encode_json(self._build_payload(prompt, temperature))
 
         for attempt in range(1, self.MAX_RETRIES + 1):
             try:
-                response = requests.post(
-                    f"{self.endpoint}?key={self.api_key}",
-                    json=payload,
+                response = self.session.post(
+                    self._url,
+                    data=body,
+                    headers=self._headers,
                     timeout=60,  # Increased for longer responses
                 )
                 if response.status_code == 401:
                     raise ConfigurationError(
                         "Invalid API key. Check the GITSTORY_API_KEY environment variable."
                     )
-                if response.status_code == 429:
+                if response.status_code in self.RETRYABLE_STATUS_CODES:
                     if attempt == self.MAX_RETRIES:
+                        if response.status_code == 429:
+                            raise SummarizationError(
+                                "Rate limit exceeded after multiple retries."
+                            )
+                        message = self._extract_error(response)
                         raise SummarizationError(
-                            "Rate limit exceeded after multiple retries."
+                            f"Gemini API error (HTTP {response.status_code}): {message}"
                         )
-                    time.sleep(self.RETRY_DELAY_SECONDS)
+                    time.sleep(self._compute_backoff(response, attempt))
                     continue
                 if response.status_code >= 400:
                     message = self._extract_error(response)
@@ -71,12 +130,12 @@ class LLMClient:
                     )
 
                 response.raise_for_status()
-                json_data = response.json()
+                json_data = _decode_json(response)
 
                 # Validate response is not empty
                 if not json_data:
                     if attempt < self.MAX_RETRIES:
-                        time.sleep(self.TIMEOUT_RETRY_DELAY_SECONDS)
+                        time.sleep(self._compute_backoff(None, attempt))
                         continue
                     raise SummarizationError(
                         "Received empty JSON response from Gemini API after retries"
@@ -86,7 +145,7 @@ class LLMClient:
                 candidates = json_data.get("candidates", [])
                 if not candidates or len(candidates) == 0:
                     if attempt < self.MAX_RETRIES:
-                        time.sleep(self.TIMEOUT_RETRY_DELAY_SECONDS)
+                        time.sleep(self._compute_backoff(None, attempt))
                         continue
                     raise SummarizationError(
                         "Received response with no candidates from Gemini API after retries"
@@ -95,7 +154,7 @@ class LLMClient:
                 # Validate basic structure of first candidate
                 if not isinstance(candidates[0], dict):
                     if attempt < self.MAX_RETRIES:
-                        time.sleep(self.TIMEOUT_RETRY_DELAY_SECONDS)
+                        time.sleep(self._compute_backoff(None, attempt))
                         continue
                     raise SummarizationError(
                         "Received malformed candidate structure from Gemini API after retries"
@@ -107,35 +166,157 @@ class LLMClient:
                     raise SummarizationError(
                         f"Request timed out after {self.MAX_RETRIES} retries"
                     )
-                time.sleep(self.TIMEOUT_RETRY_DELAY_SECONDS)
+                time.sleep(self._compute_backoff(None, attempt))
             except requests.exceptions.RequestException as request_error:
                 if attempt == self.MAX_RETRIES:
                     raise SummarizationError(
                         f"Gemini request failed: {str(request_error)}"
                     )
-                time.sleep(self.TIMEOUT_RETRY_DELAY_SECONDS)
+                time.sleep(self._compute_backoff(None, attempt))
 
         raise SummarizationError("Gemini request failed after maximum retries")
 
-    def validate_api_key(self) -> bool:
-        """Verify the API key by issuing a trivial request."""
-        payload = {
-            "contents": [{"parts": [{"text": "ping"}]}],
-            "generationConfig": {"maxOutputTokens": 4},
-        }
+    def stream(self, prompt: str, *, temperature: float = 0.5) -> Iterator[str]:
+        """Yield response text as Gemini generates it, using server-sent events.
+
+        Unlike generate(), nothing is retried: part of the answer may already
+        have been shown by the time a failure happens.
+        """
+        body = _encode_json(self._build_payload(prompt, temperature))
         try:
-            response = requests.post(
-                f"{self.endpoint}?key={self.api_key}", json=payload, timeout=10
+            response = self.session.post(
+                self._stream_url,
+                data=body,
+                headers=self._headers,
+                timeout=60,
+                stream=True,
             )
-            return response.status_code == 200
-        except requests.RequestException:
-            return False
+        except requests.exceptions.Timeout:
+            raise SummarizationError("Request timed out")
+        except requests.exceptions.RequestException as request_error:
+            raise SummarizationError(f"Gemini request failed: {str(request_error)}")
+
+        with response:
+            if response.status_code == 401:
+                raise ConfigurationError(
+                    "Invalid API key. Check the GITSTORY_API_KEY environment variable."
+                )
+            if response.status_code >= 400:
+                message = self._extract_error(response)
+                raise SummarizationError(
+                    f"Gemini API error (HTTP {response.status_code}): {message}"
+                )
+
+            try:
+                for line in response.iter_lines(decode_unicode=True):
+                    if not line or not line.startswith("data:"):
+                        continue
+                    try:
+                        chunk = _loads_json(line[len("data:") :])
+                    except ValueError:
+                        continue
+                    for text in self._chunk_texts(chunk):
+                        yield text
+            except requests.exceptions.RequestException as request_error:
+                raise SummarizationError(
+                    f"Gemini stream interrupted: {str(request_error)}"
+                )
+
+    @staticmethod
+    def _chunk_texts(chunk: Any) -> Iterator[str]:
+        """Yield the text parts of the first candidate in a streamed chunk."""
+        if not isinstance(chunk, dict):
+            return
+        candidates = chunk.get("candidates") or []
+        if not candidates or not isinstance(candidates[0], dict):
+            return
+        for part in candidates[0].get("content", {}).get("parts", []):
+            text = part.get("text") if isinstance(part, dict) else None
+            if text:
+                yield text
+
+    @staticmethod
+    def _build_payload(prompt: str, temperature: float) -> Dict[str, Any]:
+        return {
+            "contents": [{"parts": [{"text": prompt}]}],
+            "generationConfig": {
+                "temperature": temperature,  # Lower temperature for more factual, consistent output
+                "maxOutputTokens": 4000,  # Increased for dashboard format (800-1200 words)
+            },
+        }
+
+    def _compute_backoff(
+        self, response: Optional[requests.Response], attempt: int
+    ) -> float:
+        """Return how long to wait before retrying after a failed ``attempt``.
+
+        Server advice (Retry-After, X-RateLimit-Reset, retryDelay) wins when present;
+        otherwise fall back to capped exponential backoff with jitter.
+        """
+        if response is not None:
+            advised = self._server_advised_delay(response)
+            if advised is not None:
+                return min(advised, self.MAX_ADVISED_DELAY_SECONDS)
+        delay = min(
+            self.BACKOFF_CAP_SECONDS, self.BACKOFF_BASE_SECONDS * 2 ** (attempt - 1)
+        )
+        return delay + random.uniform(0, self.BACKOFF_JITTER_SECONDS)
+
+    @staticmethod
+    def _server_advised_delay(response: requests.Response) -> Optional[float]:
+        """Parse the wait time the server asked for, in seconds, if any."""
+        headers = getattr(response, "headers", None) or {}
+
+        retry_after = headers.get("Retry-After")
+        if isinstance(retry_after, str) and retry_after.strip():
+            value = retry_after.strip()
+            if value.isdigit():
+                return float(value)
+            # HTTP-date form, e.g. "Wed, 21 Oct 2015 07:28:00 GMT"
+            try:
+                retry_at = parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                retry_at = None
+            if retry_at is not None:
+                return max(0.0, retry_at.timestamp() - time.time())
+
+        reset = headers.get("X-RateLimit-Reset")
+        if isinstance(reset, str) and reset.strip():
+            try:
+                reset_value = float(reset)
+            except ValueError:
+                return None
+            # Either an absolute epoch timestamp or a number of seconds
+            if reset_value > 1_000_000_000:
+                reset_value -= time.time()
+            return max(0.0, reset_value)
+
+        return LLMClient._body_retry_delay(response)
+
+    @staticmethod
+    def _body_retry_delay(response: requests.Response) -> Optional[float]:
+        """Parse Gemini's RetryInfo ``retryDelay`` (e.g. ``"7s"``) from the body."""
+        try:
+            details = _decode_json(response)["error"]["details"]
+        except Exception:
+            return None
+        if not isinstance(details, list):
+            return None
+
+        for detail in details:
+            retry_delay = detail.get("retryDelay") if isinstance(detail, dict) else None
+            if isinstance(retry_delay, str) and retry_delay.endswith("s"):
+                try:
+                    return max(0.0, float(retry_delay[:-1]))
+                except ValueError:
+                    continue
+        return None
 
     @staticmethod
     def _extract_error(response: requests.Response) -> str:
         """Attempt to extract a meaningful error message from a Gemini response."""
         try:
-            payload = response.json()
+            payload = _decode_json(response)
         except Exception:
             return LLMClient._fallback_error_message(response)
 
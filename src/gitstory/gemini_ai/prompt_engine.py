@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import heapq
 from typing import Dict
 
 
@@ -141,15 +142,21 @@ Now analyze the repository data below:
 IMPORTANT: End your summary with [END-SUMMARY] on a new line to indicate completion.
 """
 
+    _DATA_HEADING = "# REPOSITORY DATA\n"
+    # System prompt + separator + data heading, joined once at class creation
+    _PROMPT_HEADERS = {
+        "cli": CLI_SYSTEM_PROMPT + "\n\n" + _DATA_HEADING,
+        "dashboard": DASHBOARD_SYSTEM_PROMPT + "\n\n" + _DATA_HEADING,
+    }
+
     def build_prompt(self, parsed_data: Dict, output_format: str) -> str:
         """Build a complete prompt for the requested output format."""
-        system_prompt = (
-            self.CLI_SYSTEM_PROMPT
-            if output_format == "cli"
-            else self.DASHBOARD_SYSTEM_PROMPT
+        header = self._PROMPT_HEADERS.get(
+            output_format, self._PROMPT_HEADERS["dashboard"]
         )
-        data_section = self._format_data(parsed_data)
-        return f"{system_prompt}\n\n{data_section}"
+        # Header inside the join so the (possibly multi-MB) commit history is
+        # copied once, not again by a trailing concatenation
+        return self._format_data(parsed_data, heading=header)
 
     CLI_COMPARISON_PROMPT = """You are a technical code analyst comparing two Git branches for developers.
 
@@ -200,15 +207,15 @@ EXAMPLES OF GOOD BULLETS:
 IMPORTANT: End your summary with [END-SUMMARY] on a new line to indicate completion.
 """
 
+    _COMPARISON_HEADER = CLI_COMPARISON_PROMPT + "\n\n"
+
     def build_comparison_prompt(self, comparison_data: Dict) -> str:
         """Generate comprehensive prompt for branch comparison analysis."""
-        system_prompt = self.CLI_COMPARISON_PROMPT
-        data_section = comparison_data["summary_text"]
-        return f"{system_prompt}\n\n{data_section}"
+        return self._COMPARISON_HEADER + comparison_data["summary_text"]
 
-    def _format_data(self, data: Dict) -> str:
+    def _format_data(self, data: Dict, heading: str = _DATA_HEADING) -> str:
         """Format repository data with rich context for LLM analysis."""
-        sections = ["# REPOSITORY DATA\n"]
+        sections = [heading]
         stats = data.get("stats", {})
         commits = data.get("commits", [])
 
@@ -239,10 +246,10 @@ IMPORTANT: End your summary with [END-SUMMARY] on a new line to indicate complet
         # Top contributors with focus areas
         sections.append("## Top Contributors")
         by_author = stats.get("by_author", {})
-        # Sort by commit count, show top 10
-        sorted_authors = sorted(
-            by_author.items(), key=lambda x: x[1]["count"], reverse=True
-        )[:10]
+        # Top 10 by commit count; same order as sorted(..., reverse=True)[:10]
+        sorted_authors = heapq.nlargest(
+            10, by_author.items(), key=lambda x: x[1]["count"]
+        )
         for author, author_data in sorted_authors:
             count = author_data["count"]
             percentage = (count / total * 100) if total > 0 else 0
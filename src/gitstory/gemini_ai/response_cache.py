@@ -0,0 +1,197 @@
+"""On-disk cache mapping prompts to raw Gemini responses."""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import time
+from typing import Any
+
+
+class ResponseCache:
+    """Exact-match cache of raw Gemini responses stored as JSON files.
+
+    Disabled unless the ``GITSTORY_LLM_CACHE`` environment variable is ``1``.
+    """
+
+    ENABLE_ENV_VAR = "GITSTORY_LLM_CACHE"
+    DEFAULT_CACHE_DIR = os.path.join(
+        os.path.expanduser("~"), ".cache", "gitstory", "llm"
+    )
+    DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60  # 7 days
+
+    def __init__(
+        self,
+        cache_dir: str | None = None,
+        *,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        enabled: bool | None = None,
+    ) -> None:
+        self.cache_dir = cache_dir or self.DEFAULT_CACHE_DIR
+        self.ttl_seconds = ttl_seconds
+        if enabled is None:
+            enabled = os.getenv(self.ENABLE_ENV_VAR) == "1"
+        self.enabled = enabled
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return the cached raw response for ``key``, or None on a miss."""
+        if not self.enabled:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as cache_file:
+                entry = json.load(cache_file)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(entry, dict) or not isinstance(entry.get("raw"), dict):
+            return None
+
+        # Evict stale entries so the cache directory doesn't grow forever
+        if time.time() - entry.get("ts", 0) > self.ttl_seconds:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+
+        return entry["raw"]
+
+    def set(self, key: str, raw_response: dict[str, Any]) -> None:
+        """Store ``raw_response`` under ``key``; failures are silently ignored."""
+        if not self.enabled:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Write to a temp file first so readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as cache_file:
+                    json.dump({"raw": raw_response, "ts": time.time()}, cache_file)
+                os.replace(tmp_path, self._path(key))
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError):
+            pass
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + ".json")
+
+
+class SemanticResponseCache:
+    """Near-match cache that reuses responses for almost identical prompts.
+
+    Prompts are embedded with a small local sentence-transformers model and
+    compared by cosine similarity against previously answered prompts. Opt-in
+    via ``GITSTORY_LLM_SEMANTIC_CACHE=1``; silently disabled when the optional
+    ``sentence-transformers`` package is not installed. A hit returns a summary
+    of a slightly different prompt, so keep the threshold high.
+    """
+
+    ENABLE_ENV_VAR = "GITSTORY_LLM_SEMANTIC_CACHE"
+    THRESHOLD_ENV_VAR = "GITSTORY_LLM_SEMANTIC_THRESHOLD"
+    DEFAULT_THRESHOLD = 0.98
+    DEFAULT_MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+    INDEX_FILENAME = "llm_sem.jsonl"
+
+    def __init__(
+        self,
+        cache_dir: str | None = None,
+        *,
+        ttl_seconds: float = ResponseCache.DEFAULT_TTL_SECONDS,
+        enabled: bool | None = None,
+        threshold: float | None = None,
+        model_name: str = DEFAULT_MODEL_NAME,
+    ) -> None:
+        self.cache_dir = cache_dir or ResponseCache.DEFAULT_CACHE_DIR
+        self.ttl_seconds = ttl_seconds
+        if enabled is None:
+            enabled = os.getenv(self.ENABLE_ENV_VAR) == "1"
+        self.enabled = enabled
+        if threshold is None:
+            try:
+                threshold = float(
+                    os.getenv(self.THRESHOLD_ENV_VAR, self.DEFAULT_THRESHOLD)
+                )
+            except ValueError:
+                threshold = self.DEFAULT_THRESHOLD
+        self.threshold = threshold
+        self.model_name = model_name
+        self._model = None
+        self._last_embedding = (None, None)  # (prompt, embedding) of the last lookup
+
+    def get(self, scope: str, prompt: str) -> dict[str, Any] | None:
+        """Return the response of the most similar cached prompt above threshold."""
+        embedding = self._embed(prompt)
+        if embedding is None:
+            return None
+
+        best_score = self.threshold
+        best_raw = None
+        now = time.time()
+        for entry in self._load_entries():
+            if (
+                entry.get("scope") != scope
+                or now - entry.get("ts", 0) > self.ttl_seconds
+            ):
+                continue
+            score = sum(a * b for a, b in zip(embedding, entry["embedding"]))
+            if score >= best_score:
+                best_score = score
+                best_raw = entry["raw"]
+        return best_raw
+
+    def add(self, scope: str, prompt: str, raw_response: dict[str, Any]) -> None:
+        """Append ``raw_response`` to the index under the embedding of ``prompt``."""
+        embedding = self._embed(prompt)
+        if embedding is None:
+            return
+        entry = {
+            "scope": scope,
+            "embedding": embedding,
+            "raw": raw_response,
+            "ts": time.time(),
+        }
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(self._index_path(), "a", encoding="utf-8") as index_file:
+                index_file.write(json.dumps(entry) + "\n")
+        except (OSError, TypeError, ValueError):
+            pass
+
+    def _embed(self, prompt: str) -> list | None:
+        """Return a unit-length embedding, or None when the cache is unavailable."""
+        if not self.enabled:
+            return None
+        if self._last_embedding[0] == prompt:
+            return self._last_embedding[1]
+        if self._model is None:
+            try:
+                from sentence_transformers import SentenceTransformer
+            except ImportError:
+                self.enabled = False
+                return None
+            self._model = SentenceTransformer(self.model_name)
+        embedding = self._model.encode(prompt, normalize_embeddings=True).tolist()
+        self._last_embedding = (prompt, embedding)
+        return embedding
+
+    def _load_entries(self) -> list:
+        entries = []
+        try:
+            with open(self._index_path(), encoding="utf-8") as index_file:
+                for line in index_file:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    if isinstance(entry, dict) and "embedding" in entry:
+                        entries.append(entry)
+        except OSError:
+            pass
+        return entries
+
+    def _index_path(self) -> str:
+        return os.path.join(self.cache_dir, self.INDEX_FILENAME)
@@ -2,8 +2,26 @@
 
 from __future__ import annotations
 
+import logging
 import re
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_FENCE_RE = re.compile(r"```[\w]*\n|```")
+# One match per run of code fences together with the newlines around them, or
+# per plain run of 3+ newlines, so cleaning needs a single scan of the response
+_CLEAN_RE = re.compile(r"\n*(?:(?:```[\w]*\n|```)\n*)+|\n{3,}")
+_HEADING_RE = re.compile(r"\n(#+\s)")
+_HEADING_BODY_RE = re.compile(r"(#+\s[^\n]+)\n([^#\n])")
+
+
+def _clean_match(match: re.Match) -> str:
+    """Drop fences from a match, then cap the newlines left behind at one blank line."""
+    text = match.group()
+    if "`" in text:
+        text = _FENCE_RE.sub("", text)
+    return "\n\n" if len(text) >= 3 else text
 
 
 class ResponseHandler:
@@ -26,13 +44,15 @@ class ResponseHandler:
             else:
                 content = str(content_obj)
         except Exception as error:
-            print("[DEBUG] Raw API response in process():", api_response)
+            # %r is only rendered when debug logging is enabled
+            logger.debug("Raw API response in process(): %r", api_response)
             raise ValueError(f"Invalid API response format: {error}") from error
 
         content = self._clean_content(content)
 
         # Validate content is not empty or too short
-        if not content or len(content.strip()) < 20:
+        # _clean_content has already stripped the text
+        if len(content) < 20:
             raise ValueError(
                 "Received empty or very short content from API (possible incomplete response)"
             )
@@ -46,10 +66,17 @@ class ResponseHandler:
         # Remove the end marker before returning
         content = content.replace("[END-SUMMARY]", "").strip()
 
+        # Dashboard output is used as-is; only the CLI needs reflowing
+        formatter = self._FORMATTERS.get(output_format)
+        return formatter(content) if formatter else content
+
+    def process_and_count(
+        self, api_response: Dict[str, Any], output_format: str
+    ) -> Tuple[str, int]:
+        """Return the formatted text and the total token count in one call."""
         return (
-            self._format_for_cli(content)
-            if output_format == "cli"
-            else self._format_for_dashboard(content)
+            self.process(api_response, output_format),
+            self.get_token_usage(api_response),
         )
 
     def extract_error_message(self, api_response: Dict[str, Any]) -> Optional[str]:
@@ -66,18 +93,27 @@ class ResponseHandler:
             return 0
         return int(usage.get("totalTokenCount", 0))
 
+    def get_cached_token_usage(self, api_response: Dict[str, Any]) -> int:
+        """Prompt tokens Gemini served from its context cache (0 when none)."""
+        usage = api_response.get("usageMetadata", {})
+        if not isinstance(usage, dict):
+            return 0
+        return int(usage.get("cachedContentTokenCount", 0))
+
     @staticmethod
     def _clean_content(content: str) -> str:
-        content = re.sub(r"```[\w]*\n|```", "", content)
-        content = re.sub(r"\n{3,}", "\n\n", content)
-        return content.strip()
+        # Well-formed responses have nothing for the regex to match
+        if "```" not in content and "\n\n\n" not in content:
+            return content.strip()
+        return _CLEAN_RE.sub(_clean_match, content).strip()
 
     @staticmethod
     def _format_for_cli(content: str) -> str:
-        content = re.sub(r"\n(#+\s)", r"\n\n\1", content)
-        content = re.sub(r"(#+\s[^\n]+)\n([^#\n])", r"\1\n\n\2", content)
+        # Both passes only touch markdown headings
+        if "#" not in content:
+            return content.strip()
+        content = _HEADING_RE.sub(r"\n\n\1", content)
+        content = _HEADING_BODY_RE.sub(r"\1\n\n\2", content)
         return content.strip()
 
-    @staticmethod
-    def _format_for_dashboard(content: str) -> str:
-        return content.strip()
+    _FORMATTERS = {"cli": _format_for_cli}
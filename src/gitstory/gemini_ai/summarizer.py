@@ -2,24 +2,57 @@
 
 from __future__ import annotations
 
+import hashlib
+import os
+import random
 import time
-from typing import Any, Dict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from typing import Any, Dict, Iterator, List, Optional
 
 from .llm_client import LLMClient, SummarizationError
 from .prompt_engine import PromptEngine
+from .response_cache import ResponseCache, SemanticResponseCache
 from .response_handler import ResponseHandler
 
 
 class AISummarizer:
     """Main entry point for transforming parsed repository data into narratives."""
 
+    __slots__ = (
+        "cache",
+        "client",
+        "prompt_engine",
+        "response_handler",
+        "semantic_cache",
+    )
+
     MAX_RETRY_ATTEMPTS = 3
+    # Content retries back off as min(cap, base * 2**(attempt - 1)) + uniform(0, jitter)
     RETRY_DELAY_SECONDS = 5
-
-    def __init__(self, api_key: str, model: str = "gemini-2.5-pro") -> None:
+    RETRY_DELAY_CAP_SECONDS = 30
+    RETRY_JITTER_SECONDS = 0.5
+    # Upper bound on in-flight Gemini requests for summarize_many()
+    CONCURRENCY_ENV_VAR = "GITSTORY_LLM_CONCURRENCY"
+    DEFAULT_CONCURRENCY = 4
+    END_MARKER = "[END-SUMMARY]"
+    # Returned without calling Gemini when there is nothing to summarize
+    NO_COMMITS_SUMMARY = "No commits in selected range."
+    NO_DIVERGENCE_SUMMARY = "No commits on either branch since they diverged."
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gemini-2.5-pro",
+        *,
+        use_cache: Optional[bool] = None,
+    ) -> None:
         self.client = LLMClient(api_key, model)
         self.prompt_engine = PromptEngine()
         self.response_handler = ResponseHandler()
+        # None defers to the caches' environment switches; False is --no-cache
+        self.cache = ResponseCache(enabled=use_cache)
+        self.semantic_cache = SemanticResponseCache(enabled=use_cache)
 
     def summarize(
         self,
@@ -29,25 +62,45 @@ class AISummarizer:
         temperature: float = 0.7,
     ) -> Dict[str, Any]:
         """Generate an AI summary for the provided parsed repository data with retry logic."""
+        if self._has_no_commits(parsed_data):
+            return {
+                "summary": self.NO_COMMITS_SUMMARY,
+                "metadata": {
+                    "model": self.client.model,
+                    "tokens_used": 0,
+                    "cached_tokens": 0,
+                    "commits_analyzed": 0,
+                },
+                "error": None,
+            }
+
         prompt = self.prompt_engine.build_prompt(parsed_data, output_format)
+        cache_key = self._cache_key(prompt, temperature)
+        cache_scope = f"{self.client.model}|{temperature}"
 
         # Retry loop for handling transient failures
         for attempt in range(1, self.MAX_RETRY_ATTEMPTS + 1):
             raw_response = None
-            summary_text = None
-            tokens_used = 0
             error_msg = None
-            api_error = None
 
             try:
-                # Step 1: Call LLM API (with built-in retries for API-level issues)
-                raw_response = self.client.generate(prompt, temperature=temperature)
+                # Step 1: Call LLM API (with built-in retries for API-level issues),
+                # unless an identical or near-identical prompt was already answered
+                if attempt == 1:
+                    raw_response = self.cache.get(cache_key) or self.semantic_cache.get(
+                        cache_scope, prompt
+                    )
+                from_cache = raw_response is not None
+                if not from_cache:
+                    raw_response = self.client.generate(prompt, temperature=temperature)
 
                 # Step 2: Process and validate response (checks for end marker, content quality)
-                summary_text = self.response_handler.process(
+                summary_text, tokens_used = self.response_handler.process_and_count(
                     raw_response, output_format
                 )
-                tokens_used = self.response_handler.get_token_usage(raw_response)
+                if not from_cache:
+                    self.cache.set(cache_key, raw_response)
+                    self.semantic_cache.add(cache_scope, prompt, raw_response)
 
                 # Success! Return the result
                 return {
@@ -55,6 +108,9 @@ class AISummarizer:
                     "metadata": {
                         "model": self.client.model,
                         "tokens_used": tokens_used,
+                        "cached_tokens": self.response_handler.get_cached_token_usage(
+                            raw_response
+                        ),
                         "commits_analyzed": parsed_data.get("stats", {}).get(
                             "total_commits", 0
                         ),
@@ -64,8 +120,7 @@ class AISummarizer:
 
             except SummarizationError as error:
                 # API-level errors (already retried in llm_client, don't retry again)
-                api_error = str(error)
-                break  # Exit retry loop, return error below
+                return {"summary": None, "metadata": {}, "error": str(error)}
 
             except ValueError as error:
                 # Content validation errors (empty, incomplete, missing end marker)
@@ -82,7 +137,7 @@ class AISummarizer:
 
                 if is_retryable and attempt < self.MAX_RETRY_ATTEMPTS:
                     # Retry: wait and try again
-                    time.sleep(self.RETRY_DELAY_SECONDS)
+                    time.sleep(self._retry_delay(attempt))
                     continue
                 else:
                     # Not retryable or max attempts reached
@@ -96,10 +151,38 @@ class AISummarizer:
                 break
 
         # If we get here, all retries failed or encountered a non-retryable error
-        final_error = api_error or error_msg or "Unknown error during summarization"
+        final_error = error_msg or "Unknown error during summarization"
 
         return {"summary": None, "metadata": {}, "error": final_error}
 
+    def summarize_many(
+        self,
+        parsed_data_list: List[Dict[str, Any]],
+        *,
+        output_format: str = "cli",
+        temperature: float = 0.7,
+    ) -> List[Dict[str, Any]]:
+        """Summarize several parsed datasets concurrently, preserving input order.
+
+        Each summary is network-bound, so running them on a small thread pool
+        overlaps the Gemini round-trips instead of paying for them back to back.
+        """
+        if not parsed_data_list:
+            return []
+
+        max_workers = min(self._max_concurrency(), len(parsed_data_list))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    lambda parsed_data: self.summarize(
+                        parsed_data,
+                        output_format=output_format,
+                        temperature=temperature,
+                    ),
+                    parsed_data_list,
+                )
+            )
+
     def summarize_comparison(
         self,
         comparison_data: Dict[str, Any],
@@ -111,46 +194,51 @@ class AISummarizer:
 
         Reuses existing retry logic and error handling from summarize().
         """
+        metrics = comparison_data["divergence_metrics"]
+        if not metrics["base_commit_count"] and not metrics["compare_commit_count"]:
+            return {
+                "summary": self.NO_DIVERGENCE_SUMMARY,
+                "metadata": self._comparison_metadata(comparison_data, 0),
+                "error": None,
+            }
+
         prompt = self.prompt_engine.build_comparison_prompt(comparison_data)
+        cache_key = self._cache_key(prompt, temperature)
 
         # Use same retry loop as summarize()
         for attempt in range(1, self.MAX_RETRY_ATTEMPTS + 1):
             raw_response = None
-            summary_text = None
-            tokens_used = 0
             error_msg = None
-            api_error = None
 
             try:
-                # Step 1: Call LLM API
-                raw_response = self.client.generate(prompt, temperature=temperature)
+                # Step 1: Call LLM API, unless an identical prompt was already answered
+                if attempt == 1:
+                    raw_response = self.cache.get(cache_key)
+                from_cache = raw_response is not None
+                if not from_cache:
+                    raw_response = self.client.generate(prompt, temperature=temperature)
 
                 # Step 2: Process and validate response
-                summary_text = self.response_handler.process(
-                    raw_response, output_format="cli"
+                summary_text, tokens_used = self.response_handler.process_and_count(
+                    raw_response, "cli"
                 )
-                tokens_used = self.response_handler.get_token_usage(raw_response)
+                if not from_cache:
+                    self.cache.set(cache_key, raw_response)
 
                 # Success! Return the result
                 return {
                     "summary": summary_text,
-                    "metadata": {
-                        "base_branch": comparison_data["base_branch"],
-                        "compare_branch": comparison_data["compare_branch"],
-                        "merge_base": comparison_data["merge_base"]["hash"],
-                        "divergence_time": comparison_data["divergence_metrics"][
-                            "time_since_divergence"
-                        ],
-                        "model": self.client.model,
-                        "tokens_used": tokens_used,
-                    },
+                    "metadata": self._comparison_metadata(
+                        comparison_data,
+                        tokens_used,
+                        self.response_handler.get_cached_token_usage(raw_response),
+                    ),
                     "error": None,
                 }
 
             except SummarizationError as error:
                 # API-level errors (already retried in llm_client)
-                api_error = str(error)
-                break
+                return {"summary": None, "metadata": None, "error": str(error)}
 
             except ValueError as error:
                 # Content validation errors
@@ -166,7 +254,7 @@ class AISummarizer:
                 )
 
                 if is_retryable and attempt < self.MAX_RETRY_ATTEMPTS:
-                    time.sleep(self.RETRY_DELAY_SECONDS)
+                    time.sleep(self._retry_delay(attempt))
                     continue
                 else:
                     break
@@ -179,12 +267,91 @@ class AISummarizer:
                 break
 
         # All retries failed
-        final_error = (
-            api_error or error_msg or "Unknown error during comparison summarization"
-        )
+        final_error = error_msg or "Unknown error during comparison summarization"
 
         return {"summary": None, "metadata": None, "error": final_error}
 
+    def summarize_stream(
+        self,
+        parsed_data: Dict[str, Any],
+        *,
+        temperature: float = 0.7,
+    ) -> Iterator[str]:
+        """Yield a CLI summary piece by piece while Gemini is still generating it.
+
+        The end marker is stripped on the fly. Streamed text skips the caches,
+        retries and CLI reformatting that summarize() applies.
+        """
+        if self._has_no_commits(parsed_data):
+            yield self.NO_COMMITS_SUMMARY
+            return
+
+        prompt = self.prompt_engine.build_prompt(parsed_data, "cli")
+        marker = self.END_MARKER
+        pending = ""
+        # Closing the client stream on the marker drops the connection at once,
+        # so any tokens generated after it are neither awaited nor read
+        with closing(self.client.stream(prompt, temperature=temperature)) as chunks:
+            for text in chunks:
+                pending += text
+                end = pending.find(marker)
+                if end != -1:
+                    if pending[:end]:
+                        yield pending[:end]
+                    return
+                # Hold back a tail that could be the start of a split marker
+                safe = len(pending) - (len(marker) - 1)
+                if safe > 0:
+                    yield pending[:safe]
+                    pending = pending[safe:]
+        if pending:
+            yield pending
+        raise SummarizationError(
+            "Incomplete response: missing [END-SUMMARY] marker. "
+            "The response may have been cut off."
+        )
+
+    def _max_concurrency(self) -> int:
+        """Read the concurrency limit from the environment, falling back to the default."""
+        try:
+            value = int(os.getenv(self.CONCURRENCY_ENV_VAR, self.DEFAULT_CONCURRENCY))
+        except ValueError:
+            return self.DEFAULT_CONCURRENCY
+        return max(1, value)
+
+    def _retry_delay(self, attempt: int) -> float:
+        """Seconds to wait after content-validation failure number ``attempt``."""
+        delay = min(
+            self.RETRY_DELAY_CAP_SECONDS, self.RETRY_DELAY_SECONDS * 2 ** (attempt - 1)
+        )
+        return delay + random.uniform(0, self.RETRY_JITTER_SECONDS)
+
+    @staticmethod
+    def _has_no_commits(parsed_data: Dict[str, Any]) -> bool:
+        """True when the parser reported an empty range (not merely missing stats)."""
+        return parsed_data.get("stats", {}).get("total_commits") == 0
+
+    def _comparison_metadata(
+        self, comparison_data: Dict[str, Any], tokens_used: int, cached_tokens: int = 0
+    ) -> Dict[str, Any]:
+        return {
+            "base_branch": comparison_data["base_branch"],
+            "compare_branch": comparison_data["compare_branch"],
+            "merge_base": comparison_data["merge_base"]["hash"],
+            "divergence_time": comparison_data["divergence_metrics"][
+                "time_since_divergence"
+            ],
+            "model": self.client.model,
+            "tokens_used": tokens_used,
+            "cached_tokens": cached_tokens,
+        }
+
+    def _cache_key(self, prompt: str, temperature: float) -> str:
+        """Key cached responses on everything that influences the model output."""
+        return hashlib.blake2b(
+            f"{self.client.model}|{temperature}|{prompt}".encode(), digest_size=16
+        ).hexdigest()
+
     @staticmethod
     def _build_error_result(message: str) -> Dict[str, Any]:
         """Create a standardized error payload for downstream consumers."""
@@ -3,14 +3,24 @@ Branch comparison logic.
 Processes and analyzes differences between two Git branches.
 """
 
+import time
 from typing import List, Dict
 from datetime import datetime
+from itertools import chain
 from .commit_grouper import CommitGrouper
 
 
 class BranchComparator:
     """Processes and structures branch comparison data."""
 
+    # (minimum age, unit length, label) in seconds, largest first; a month is
+    # only reported past 30 full days
+    TIME_UNITS = (
+        (31 * 86400, 30 * 86400, "month"),
+        (86400, 86400, "day"),
+        (3600, 3600, "hour"),
+    )
+
     def __init__(self, commit_grouper: CommitGrouper):
         self.grouper = commit_grouper
 
@@ -73,20 +83,21 @@ class BranchComparator:
         base_contributors = list(set(c["author"] for c in base_commits))
         compare_contributors = list(set(c["author"] for c in compare_commits))
 
-        # Calculate time since divergence
-        merge_base_time = datetime.fromisoformat(merge_base["timestamp"])
-        now = datetime.now()
-        time_diff = now - merge_base_time
+        # Calculate time since divergence, from the raw epoch when available
+        merge_base_epoch = merge_base.get("committed_epoch")
+        if merge_base_epoch is not None:
+            elapsed = int(time.time() - merge_base_epoch)
+        else:
+            time_diff = datetime.now() - datetime.fromisoformat(merge_base["timestamp"])
+            elapsed = int(time_diff.total_seconds())
 
         # Format time difference in human-readable format
-        if time_diff.days > 30:
-            time_since = f"{time_diff.days // 30} month{'s' if time_diff.days // 30 != 1 else ''} ago"
-        elif time_diff.days > 0:
-            time_since = f"{time_diff.days} day{'s' if time_diff.days != 1 else ''} ago"
-        elif time_diff.seconds >= 3600:
-            time_since = f"{time_diff.seconds // 3600} hour{'s' if time_diff.seconds // 3600 != 1 else ''} ago"
-        else:
-            time_since = "recently"
+        time_since = "recently"
+        for min_age, unit, label in self.TIME_UNITS:
+            if elapsed >= min_age:
+                count = elapsed // unit
+                time_since = f"{count} {label}{'s' if count != 1 else ''} ago"
+                break
 
         return {
             "time_since_divergence": time_since,
@@ -101,21 +112,16 @@ class BranchComparator:
     ) -> Dict:
         """Analyze file changes to identify unique and shared files."""
         # Collect all files changed in each branch
-        base_files = set()
-        for commit in base_commits:
-            base_files.update(commit.get("files_changed", []))
-
-        compare_files = set()
-        for commit in compare_commits:
-            compare_files.update(commit.get("files_changed", []))
+        base_files = set(
+            chain.from_iterable(c.get("files_changed", ()) for c in base_commits)
+        )
+        compare_files = set(
+            chain.from_iterable(c.get("files_changed", ()) for c in compare_commits)
+        )
 
         # Identify unique and shared files
-        base_only_files = list(base_files - compare_files)
-        compare_only_files = list(compare_files - base_files)
-        shared_files = list(base_files & compare_files)
-
         return {
-            "base_only_files": sorted(base_only_files),
-            "compare_only_files": sorted(compare_only_files),
-            "shared_files": sorted(shared_files),  # Conflict risk
+            "base_only_files": sorted(base_files - compare_files),
+            "compare_only_files": sorted(compare_files - base_files),
+            "shared_files": sorted(base_files & compare_files),  # Conflict risk
         }
@@ -3,6 +3,7 @@ Groups commits by type and semantic meaning.
 Uses commit message patterns to classify commits.
 """
 
+from collections import Counter, defaultdict
 from typing import List, Dict
 import re
 
@@ -37,6 +38,13 @@ class CommitGrouper:
         ],
     }
 
+    # One compiled alternation per type, tried in PATTERNS order: a type matches
+    # exactly when any of its patterns would, so priority between types is kept
+    _COMPILED_PATTERNS = tuple(
+        (commit_type, re.compile("|".join(f"(?:{p})" for p in patterns)))
+        for commit_type, patterns in PATTERNS.items()
+    )
+
     def group_commits(self, commits: List[Dict]) -> Dict:
         grouped = {
             "feature": [],
@@ -48,36 +56,24 @@ class CommitGrouper:
             "chore": [],
             "other": [],
         }
-        author_stats = {}
-        # Track email to name mapping for consolidation
-        email_to_name = {}
+        author_stats = defaultdict(lambda: {"count": 0, "types": Counter(), "name": ""})
 
         for commit in commits:
             commit_type = self._classify_commit(commit["message"])
             grouped[commit_type].append(commit)
 
             # Use email as the key for consolidation (fallback to author name if no email)
-            email = commit.get("email", commit["author"])
             author_name = commit["author"]
-
+            stats = author_stats[commit.get("email", author_name)]
+            stats["count"] += 1
+            stats["types"][commit_type] += 1
             # Store the author name (prefer longer/more complete names)
-            if email not in email_to_name or len(author_name) > len(
-                email_to_name[email]
-            ):
-                email_to_name[email] = author_name
-
-            if email not in author_stats:
-                author_stats[email] = {"count": 0, "types": {}, "name": author_name}
-
-            author_stats[email]["count"] += 1
-            author_stats[email]["name"] = email_to_name[email]
-            author_stats[email]["types"][commit_type] = (
-                author_stats[email]["types"].get(commit_type, 0) + 1
-            )
+            if len(author_name) > len(stats["name"]):
+                stats["name"] = author_name
 
         # Convert email keys to author names for display
         author_stats_by_name = {
-            data["name"]: {"count": data["count"], "types": data["types"]}
+            data["name"]: {"count": data["count"], "types": dict(data["types"])}
             for data in author_stats.values()
         }
 
@@ -92,8 +88,7 @@ class CommitGrouper:
 
     def _classify_commit(self, message: str) -> str:
         message_lower = message.lower()
-        for commit_type, patterns in self.PATTERNS.items():
-            for pattern in patterns:
-                if re.search(pattern, message_lower):
-                    return commit_type
+        for commit_type, pattern in self._COMPILED_PATTERNS:
+            if pattern.search(message_lower):
+                return commit_type
         return "other"
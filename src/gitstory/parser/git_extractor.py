@@ -3,16 +3,25 @@ Git data extraction using GitPython.
 Handles all direct Git repository interactions.
 """
 
-from git import Repo, InvalidGitRepositoryError
+from git import Repo, GitCommandError, InvalidGitRepositoryError
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict
+import os
 import re
 
 
 class GitExtractor:
     """Extracts commit metadata from Git repositories."""
 
-    def __init__(self, repo_path: str):
+    # Commits whose changes are fetched per ``git log`` call
+    CHANGES_BATCH_SIZE = 200
+    MAX_CHANGES_WORKERS = 8
+    # Diff text kept per commit; DataCleaner slices it into 2000-char chunks
+    MAX_DIFF_CHARS = 16000
+    DIFF_TRUNCATED_MARKER = "... diff truncated ..."
+
+    def __init__(self, repo_path: str, max_diff_chars: Optional[int] = MAX_DIFF_CHARS):
         try:
             self.repo = Repo(repo_path)
         except InvalidGitRepositoryError:
@@ -20,6 +29,10 @@ class GitExtractor:
                 f"Not a valid Git repository: {repo_path}\n"
                 f"Please run this command in a Git repository or use 'git init'"
             )
+        # Formatted commits by full hexsha; a commit's data never changes
+        self._commit_cache: Dict[str, Dict] = {}
+        # None keeps every diff whole
+        self.max_diff_chars = max_diff_chars
 
     def get_commits(
         self,
@@ -34,34 +47,8 @@ class GitExtractor:
             branch_list = [b.name for b in self.repo.branches]
             if branch not in branch_list:
                 raise ValueError(f"Branch not found: {branch}. Available branches: {', '.join(branch_list)}")
-        
-        since_dt = self._parse_time(since) if since else None
-        until_dt = self._parse_time(until) if until else datetime.now()
-        commits = []
-        for commit in self.repo.iter_commits(branch):
-            commit_time = datetime.fromtimestamp(commit.committed_date)
-            if since_dt and commit_time < since_dt:
-                break
-            if commit_time > until_dt:
-                continue
-            try:
-                diff_text = self._get_commit_diff(commit)
-            except Exception as e:
-                diff_text = f"Error extracting diff: {str(e)}"
-            
-            commit_obj = {
-                "hash": commit.hexsha[:8],
-                "author": commit.author.name,
-                "email": commit.author.email,
-                "timestamp": commit_time.isoformat(),
-                "message": commit.message.strip(),
-                "files_changed": self._get_changed_files(commit),
-                "insertions": commit.stats.total["insertions"],
-                "deletions": commit.stats.total["deletions"],
-                "diff": diff_text,
-            }
-            commits.append(commit_obj)
-        return commits
+
+        return self._format_commits(self._commits_in_window(branch, since, until))
 
     def _parse_time(self, time_str: str) -> datetime:
         try:
@@ -82,6 +69,39 @@ class GitExtractor:
             return datetime.now() - delta
         raise ValueError(f"Invalid time format: {time_str}")
 
+    def _commits_in_window(
+        self, rev: str, since: Optional[str], until: Optional[str]
+    ) -> List:
+        """Lists the commits of ``rev`` committed between since and until."""
+        since_dt = self._parse_time(since) if since else None
+        until_dt = self._parse_time(until) if until else datetime.now()
+        # Compare raw epoch seconds rather than building a datetime per commit
+        since_ts = since_dt.timestamp() if since_dt else None
+        until_ts = until_dt.timestamp()
+
+        commits = []
+        # Only explicit bounds go to git; the default "until now" is checked below
+        options = self._time_filter_options(since_dt, until_dt if until else None)
+        for commit in self.repo.iter_commits(rev, **options):
+            committed = commit.committed_date
+            if since_ts is not None and committed < since_ts:
+                continue
+            if committed > until_ts:
+                continue
+            commits.append(commit)
+        return commits
+
+    def _time_filter_options(
+        self, since_dt: Optional[datetime], until_dt: Optional[datetime]
+    ) -> Dict[str, str]:
+        """Builds iter_commits options so git skips commits outside the window."""
+        options = {}
+        if since_dt:
+            options["since"] = since_dt.isoformat()
+        if until_dt:
+            options["until"] = until_dt.isoformat()
+        return options
+
     def _get_changed_files(self, commit) -> List[str]:
         if not commit.parents:
             return []
@@ -92,17 +112,188 @@ class GitExtractor:
         """Extracts the full diff text for a commit."""
         if not commit.parents:
             # Initial commit, show all files as added
-            return "\n".join([f"A {obj.path}" for obj in commit.tree.traverse()])
+            return self._join_diff(f"A {obj.path}" for obj in commit.tree.traverse())
         diff = commit.parents[0].diff(commit, create_patch=True)
-        return "\n".join(
-            [
-                d.diff.decode(errors="ignore")
-                if hasattr(d.diff, "decode")
-                else str(d.diff)
-                for d in diff
-            ]
+        return self._join_diff(
+            d.diff.decode(errors="ignore")
+            if hasattr(d.diff, "decode")
+            else str(d.diff)
+            for d in diff
         )
 
+    def _join_diff(self, parts) -> str:
+        """
+        Joins diff parts with newlines, capped at max_diff_chars.
+
+        ``parts`` is consumed lazily, so nothing past the cap is generated;
+        truncated text ends with DIFF_TRUNCATED_MARKER.
+        """
+        if self.max_diff_chars is None:
+            return "\n".join(parts)
+        kept = []
+        size = 0
+        for part in parts:
+            kept.append(part)
+            size += len(part) + 1
+            if size > self.max_diff_chars + 1:
+                text = "\n".join(kept)[: self.max_diff_chars]
+                return f"{text}\n{self.DIFF_TRUNCATED_MARKER}"
+        return "\n".join(kept)
+
+    def _get_commit_changes(self, commit) -> Dict:
+        """
+        Collects files_changed, insertions, deletions and diff for a commit.
+
+        Normal commits take files_changed and diff from one patch diff
+        against their first parent; line counts always come from
+        ``commit.stats`` (numstat without rename detection). Root commits and
+        failed diffs fall back to the per-field helpers.
+        """
+        if commit.parents:
+            try:
+                diff = commit.parents[0].diff(commit, create_patch=True)
+            except Exception as e:
+                diff_text = f"Error extracting diff: {str(e)}"
+            else:
+                # a_path is None for added files
+                files_changed = [d.a_path or d.b_path for d in diff]
+                patches = (
+                    d.diff.decode(errors="ignore")
+                    if hasattr(d.diff, "decode")
+                    else str(d.diff)
+                    for d in diff
+                )
+                return {
+                    "files_changed": files_changed,
+                    "insertions": commit.stats.total.get("insertions", 0),
+                    "deletions": commit.stats.total.get("deletions", 0),
+                    "diff": self._join_diff(patches),
+                }
+        else:
+            try:
+                diff_text = self._get_commit_diff(commit)
+            except Exception as e:
+                diff_text = f"Error extracting diff: {str(e)}"
+
+        return {
+            "files_changed": self._get_changed_files(commit),
+            "insertions": commit.stats.total.get("insertions", 0),
+            "deletions": commit.stats.total.get("deletions", 0),
+            "diff": diff_text,
+        }
+
+    def _get_changes_batch(self, commits) -> Dict[str, Dict]:
+        """
+        Collects _get_commit_changes fields for many commits at once.
+
+        Runs one ``git log --no-walk`` per CHANGES_BATCH_SIZE commits instead
+        of one diff per commit, diffing each against its first parent; large
+        histories run their batches in parallel. Returns a dict keyed by full
+        hexsha; commits missing from it should go through _get_commit_changes.
+        """
+        batches = [
+            commits[start : start + self.CHANGES_BATCH_SIZE]
+            for start in range(0, len(commits), self.CHANGES_BATCH_SIZE)
+        ]
+        max_workers = min(self.MAX_CHANGES_WORKERS, os.cpu_count() or 1)
+        if max_workers > 1 and len(batches) > 1:
+            # Each git log is its own subprocess, so workers share nothing
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(self._log_changes, batches))
+        else:
+            results = map(self._log_changes, batches)
+
+        changes = {}
+        for result in results:
+            changes.update(result)
+        return changes
+
+    def _log_changes(self, commits) -> Dict[str, Dict]:
+        """Runs the ``git log`` calls of one _get_changes_batch batch."""
+        hexshas = [commit.hexsha for commit in commits]
+        try:
+            # Files and hunks follow renames like GitPython's diff -M ...
+            changes = self._parse_log_changes(
+                self._log(hexshas, "-M", "--numstat", "-p")
+            )
+            # ... while line counts don't, matching commit.stats
+            counts = self._parse_log_changes(
+                self._log(hexshas, "--no-renames", "--numstat")
+            )
+        except GitCommandError:
+            return {}
+
+        for hexsha in list(changes):
+            count = counts.get(hexsha)
+            if count is None:
+                del changes[hexsha]
+                continue
+            changes[hexsha]["insertions"] = count["insertions"]
+            changes[hexsha]["deletions"] = count["deletions"]
+        return changes
+
+    def _log(self, hexshas: List[str], *options: str) -> str:
+        """Runs ``git log`` over exactly ``hexshas``, each against its first parent."""
+        output = self.repo.git.log(
+            "--no-walk=unsorted",
+            "-m",
+            "--first-parent",
+            *options,
+            "-z",
+            "--no-color",
+            "--format=%x00%x01%H",
+            *hexshas,
+            stdout_as_string=False,
+        )
+        return output.decode(errors="ignore")
+
+    def _parse_log_changes(self, output: str) -> Dict[str, Dict]:
+        """Parses the ``git log --numstat -p -z`` output of _log_changes."""
+        changes = {}
+        for record in output.split("\x00\x01")[1:]:
+            hexsha, _, body = record.partition("\x00")
+            # Numstat entries are NUL-terminated and an empty one precedes the patch
+            numstat, _, patch = body.lstrip("\n").partition("\x00\x00")
+
+            files_changed = []
+            insertions = deletions = 0
+            fields = iter(numstat.split("\x00"))
+            for field in fields:
+                if not field:
+                    continue
+                added, deleted, path = field.split("\t", 2)
+                if not path:
+                    # Renames list the old and new path as separate fields
+                    path = next(fields, "")
+                    next(fields, None)
+                files_changed.append(path)
+                # Binary files report "-" for both counts
+                insertions += int(added) if added.isdigit() else 0
+                deletions += int(deleted) if deleted.isdigit() else 0
+
+            # Keep only the hunks of each file, like GitPython's Diff.diff
+            hunks = []
+            for section in patch.split("\ndiff --git ") if patch else []:
+                hunk_start = section.find("\n@@")
+                if hunk_start == -1:
+                    hunk_start = section.find("\nBinary files ")
+                hunks.append(
+                    section[hunk_start + 1 :].rstrip("\n") + "\n"
+                    if hunk_start != -1
+                    else ""
+                )
+
+            changes.setdefault(
+                hexsha,
+                {
+                    "files_changed": files_changed,
+                    "insertions": insertions,
+                    "deletions": deletions,
+                    "diff": self._join_diff(hunks),
+                },
+            )
+        return changes
+
     def get_branch_list(self) -> List[str]:
         return [branch.name for branch in self.repo.branches]
 
@@ -175,42 +366,44 @@ class GitExtractor:
         until: Optional[str] = None,
     ) -> List[Dict]:
         """Extract commits in a range, with optional time filtering."""
-        since_dt = self._parse_time(since) if since else None
-        until_dt = self._parse_time(until) if until else datetime.now()
-
-        commits = []
-        for commit in self.repo.iter_commits(revision_range):
-            commit_time = datetime.fromtimestamp(commit.committed_date)
-            if since_dt and commit_time < since_dt:
-                continue
-            if commit_time > until_dt:
-                continue
-            commits.append(self._format_commit(commit))
-        return commits
+        return self._format_commits(
+            self._commits_in_window(revision_range, since, until)
+        )
 
     def _extract_commits_from_point(self, start_commit, max_count: int) -> List[Dict]:
         """Extract commits starting from a specific commit."""
-        commits = []
-        for commit in self.repo.iter_commits(start_commit, max_count=max_count):
-            commits.append(self._format_commit(commit))
-        return commits
+        return self._format_commits(
+            list(self.repo.iter_commits(start_commit, max_count=max_count))
+        )
 
-    def _format_commit(self, commit) -> Dict:
+    def _format_commits(self, commits) -> List[Dict]:
+        """Format GitPython commits, fetching their changes in batches."""
+        changes = self._get_changes_batch(
+            [c for c in commits if c.parents and c.hexsha not in self._commit_cache]
+        )
+        return [self._format_commit(c, changes.get(c.hexsha)) for c in commits]
+
+    def _format_commit(self, commit, changes: Optional[Dict] = None) -> Dict:
         """Format a GitPython commit object into standard dict format."""
-        commit_time = datetime.fromtimestamp(commit.committed_date)
-        try:
-            diff_text = self._get_commit_diff(commit)
-        except Exception as e:
-            diff_text = f"Error extracting diff: {str(e)}"
+        cached = self._commit_cache.get(commit.hexsha)
+        if cached is None:
+            cached = self._commit_cache[commit.hexsha] = self._build_commit(
+                commit, changes
+            )
+        # Callers edit their commits in place (e.g. DataCleaner truncating
+        # messages), so never hand out the cached dict itself
+        return {**cached, "files_changed": list(cached["files_changed"])}
 
+    def _build_commit(self, commit, changes: Optional[Dict]) -> Dict:
+        commit_time = datetime.fromtimestamp(commit.committed_date)
+        if changes is None:
+            changes = self._get_commit_changes(commit)
         return {
             "hash": commit.hexsha[:8],
             "author": commit.author.name,
             "email": commit.author.email,
             "timestamp": commit_time.isoformat(),
+            "committed_epoch": commit.committed_date,
             "message": commit.message.strip(),
-            "files_changed": self._get_changed_files(commit),
-            "insertions": commit.stats.total.get("insertions", 0),
-            "deletions": commit.stats.total.get("deletions", 0),
-            "diff": diff_text,
+            **changes,
         }
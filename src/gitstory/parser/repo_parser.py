@@ -1,9 +1,27 @@
-import git
-from typing import List, Dict
+from __future__ import annotations
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, List, Dict
+
+# GitPython is slow to import, so it is only loaded once a parser is created
+if TYPE_CHECKING:
+    import git
 
 class RepoParser:
-    def __init__(self, repo_path: str):
-        self.repo = git.Repo(repo_path)
+    __slots__ = ("_commit_cache", "_file_changes_cache", "_static", "repo")
+
+    MAX_BULK_WORKERS = 8
+
+    def __init__(self, repo_path: str, static: bool = False):
+        self.repo = self._open_repo(repo_path)
+        # A static repo isn't expected to change while we read it, so resolved
+        # revisions can be reused instead of asking git again
+        self._static = static
+        self._commit_cache: Dict[str, git.Commit] = {}
+        self._file_changes_cache: Dict[str, List[str]] = {}
 
     def get_branches(self) -> List[str]:
         """Return a list of branch names in the repository."""
@@ -11,21 +29,88 @@ class RepoParser:
 
     def get_recent_commits(self, branch: str = None, count: int = 5) -> List[Dict]:
         """Return a list of recent commits for a branch."""
+        # Iterate lazily in one pass instead of materializing the commit list first
         if branch:
-            commits = list(self.repo.iter_commits(branch, max_count=count))
+            commits = self.repo.iter_commits(branch, max_count=count, paths=None, no_merges=False)
         else:
-            commits = list(self.repo.iter_commits(max_count=count))
+            commits = self.repo.iter_commits(max_count=count, paths=None, no_merges=False)
         return [
             {
                 "hexsha": commit.hexsha,
                 "author": commit.author.name,
-                "date": commit.committed_datetime.isoformat(),
+                "date": self._committed_isoformat(commit),
                 "message": commit.message.strip()
             }
             for commit in commits
         ]
 
+    @staticmethod
+    def _committed_isoformat(commit) -> str:
+        """Return committed_datetime.isoformat() without building the tzoffset object."""
+        # GitPython stores the offset as seconds west of UTC
+        tz = timezone(timedelta(seconds=-commit.committer_tz_offset))
+        return datetime.fromtimestamp(commit.committed_date, tz).isoformat()
+
     def get_file_changes(self, commit_hexsha: str) -> List[str]:
-        """Return a list of changed files for a given commit."""
-        commit = self.repo.commit(commit_hexsha)
-        return [diff.a_path for diff in commit.diff(None)]
+        """Return the files a commit changed relative to its first parent.
+
+        Results are cached per commit for the lifetime of this parser.
+        """
+        return self._file_changes_in(self.repo, commit_hexsha)
+
+    def get_file_changes_bulk(self, hexshas: List[str]) -> Dict[str, List[str]]:
+        """Return the changed files of several commits, computed in parallel."""
+        # Repo objects share a git cat-file process, so each worker opens its own
+        local = threading.local()
+        opened: List[git.Repo] = []
+
+        def worker(hexsha: str) -> List[str]:
+            repo = getattr(local, "repo", None)
+            if repo is None:
+                repo = local.repo = self._open_repo(self.repo.git_dir)
+                opened.append(repo)
+            return self._file_changes_in(repo, hexsha)
+
+        max_workers = min(self.MAX_BULK_WORKERS, os.cpu_count() or 1)
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                return dict(zip(hexshas, executor.map(worker, hexshas)))
+        finally:
+            for repo in opened:
+                repo.close()
+
+    def _file_changes_in(self, repo: git.Repo, commit_hexsha: str) -> List[str]:
+        commit = self._resolve_commit(repo, commit_hexsha)
+        cached = self._file_changes_cache.get(commit.hexsha)
+        if cached is None:
+            # Compare against the parent so the working tree is never scanned.
+            # Diffing from the parent side makes renames report their old path,
+            # as GitExtractor does; added files only have a b_path.
+            parents = commit.parents
+            if parents:
+                diffs = parents[0].diff(commit, create_patch=False)
+            else:
+                from git import NULL_TREE
+
+                diffs = commit.diff(NULL_TREE, create_patch=False)
+            cached = [diff.a_path or diff.b_path for diff in diffs]
+            self._file_changes_cache[commit.hexsha] = cached
+        return list(cached)
+
+    def _resolve_commit(self, repo: git.Repo, rev: str) -> git.Commit:
+        # Commit objects are bound to their repo, so only cache our own
+        if not self._static or repo is not self.repo:
+            return repo.commit(rev)
+        commit = self._commit_cache.get(rev)
+        if commit is None:
+            commit = self._commit_cache[rev] = repo.commit(rev)
+        return commit
+
+    @staticmethod
+    def _open_repo(path: str) -> git.Repo:
+        import git
+
+        repo = git.Repo(path)
+        # Skip the system-wide gitattributes lookup on every diff git runs for us
+        repo.git.update_environment(GIT_ATTR_NOSYSTEM="1")
+        return repo
@@ -1,14 +1,26 @@
 import os
+import threading
+
+# key path -> (mtime_ns, size, key); re-read only when the file changes
+_cache = {}
+_cache_lock = threading.Lock()
 
 
 # catches the key
 def read_key(cur_folder) -> str:
-    try:
-        key_path = cur_folder + "/data/key.txt"
+    key_path = cur_folder + "/data/key.txt"
+    stat = os.stat(key_path)
+    if stat.st_size > 250:
+        raise ValueError(f"File {key_path} too large to be reasonable!")
+
+    with _cache_lock:
+        cached = _cache.get(key_path)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+
         with open(key_path, "r") as key_f:
-            if os.path.getsize(key_path) > 250:
-                raise ValueError(f"File {key_path} too large to be reasonable!")
             ret = key_f.read()
-            return ret
-    except:
-        raise
+        if not ret.strip():
+            raise ValueError(f"File {key_path} is empty!")
+        _cache[key_path] = (stat.st_mtime_ns, stat.st_size, ret)
+        return ret
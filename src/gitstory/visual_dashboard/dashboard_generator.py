@@ -3,7 +3,13 @@ import markdown
 import shutil
 
 # Jinja allows dyanmic variable reassignment for static HTML files
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    select_autoescape,
+)
+from markupsafe import Markup
 
 # These take the current path to this folder, and appends "templates"
 CURR_DIR = os.path.dirname(__file__)
@@ -11,7 +17,31 @@ TEMPLATE_DIR = os.path.join(CURR_DIR, "templates")
 
 # This creates a Jinja2 object which stores & manages templates
 # We tell it to look for templates inside the folder specific in the TEMPLATE_DIR path
-env = Environment(loader=FileSystemLoader(TEMPLATE_DIR))
+# The shipped template never changes at runtime, so skip the freshness stat and
+# keep compiled bytecode on disk to speed up the next run.
+# Commit messages and author names come straight from git, so escape them
+env = Environment(
+    loader=FileSystemLoader(TEMPLATE_DIR),
+    autoescape=select_autoescape(["html"]),
+    auto_reload=False,
+    # Cached bytecode is keyed on the template source only; bump the version in
+    # the pattern whenever an option that changes compiled code (like
+    # autoescape) changes, or stale unescaped bytecode would be reused
+    bytecode_cache=FileSystemBytecodeCache(pattern="__gitstory_v2_%s.cache"),
+)
+
+# Write buffer for the generated page (1 MiB)
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Loaded on first use so a missing template fails at generation, not import
+_dashboard_template = None
+
+
+def _get_template():
+    global _dashboard_template
+    if _dashboard_template is None:
+        _dashboard_template = env.get_template("dashboard_template.html")
+    return _dashboard_template
 
 
 def generate_dashboard(
@@ -25,19 +55,10 @@ def generate_dashboard(
     os.makedirs(OUTPUT_DIR, exist_ok=True)
 
     # We fetch the specified template first through the Jinja2 object
-    template = env.get_template("dashboard_template.html")
-
-    html_summary = markdown.markdown(ai_summary.get("summary", ""))
+    template = _get_template()
 
-    # We render the specified template with these paramaters
-    html_content = template.render(
-        commits=repo_data.get("commits", []),
-        stats=repo_data.get("stats", {}),
-        ai_summary={
-            "summary": html_summary,
-            "metadata": ai_summary.get("metadata", {}),
-        },
-    )
+    # The summary is rendered to HTML here, so it must not be escaped again
+    html_summary = Markup(markdown.markdown(ai_summary.get("summary", "")))
 
     css_source = os.path.join(CURR_DIR, "static", "styles.css")  # adjust if needed
     css_dest = os.path.join(OUTPUT_DIR, "styles.css")
@@ -50,10 +71,23 @@ def generate_dashboard(
     # We append the output file to the OUTPUT_DIR path
     output_path = os.path.join(OUTPUT_DIR, output_file)
 
-    # We write the html contents into the output file
+    # We stream the rendered template straight into the output file, so the
+    # whole page is never held in memory at once
     #'with ... as f' makes it so that it closes the file automatically over having to do f.close()
-    with open(output_path, "w", encoding='utf-8') as f:
-        f.write(html_content)
+    # Binary mode with a large buffer: the chunks are UTF-8 encoded as they are
+    # dumped and reach the disk in a handful of write() calls
+    with open(output_path, "wb", buffering=OUTPUT_BUFFER_SIZE) as f:
+        stream = template.stream(
+            commits=repo_data.get("commits", []),
+            stats=repo_data.get("stats", {}),
+            ai_summary={
+                "summary": html_summary,
+                "metadata": ai_summary.get("metadata", {}),
+            },
+        )
+        # Group small template chunks into fewer writes
+        stream.enable_buffering(size=5)
+        stream.dump(f, encoding="utf-8")
 
     print(f"Dashboard generated: {os.path.abspath(output_path)}")
 
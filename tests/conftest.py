@@ -487,3 +487,51 @@ def mock_env_without_api_key(monkeypatch):
         monkeypatch: pytest's monkeypatch fixture
     """
     monkeypatch.delenv("GEMINI_API_KEY", raising=False)
+
+
+@pytest.fixture
+def git_repo(tmp_path):
+    """
+    Returns a real, empty Git repository on branch "main".
+
+    Args:
+        tmp_path: pytest's tmp_path fixture
+    """
+    import git
+
+    repo = git.Repo.init(tmp_path / "repo", initial_branch="main")
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "Test Author")
+        config.set_value("user", "email", "test@example.com")
+    yield repo
+    repo.close()
+
+
+@pytest.fixture
+def commit_files(git_repo):
+    """
+    Returns a helper that writes, renames and deletes files in git_repo,
+    then commits them and returns the new commit.
+
+    Usage: commit_files("msg", {"a.py": "text"}, rename={"a.py": "b.py"},
+    remove=["c.py"])
+    """
+    import os
+
+    def _commit(message, files=None, rename=None, remove=()):
+        root = git_repo.working_tree_dir
+        for old, new in (rename or {}).items():
+            os.makedirs(os.path.dirname(os.path.join(root, new)), exist_ok=True)
+            git_repo.git.mv(old, new)
+        for path, content in (files or {}).items():
+            full_path = os.path.join(root, path)
+            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            with open(full_path, "w") as f:
+                f.write(content)
+            git_repo.git.add(path)
+        for path in remove:
+            git_repo.git.rm(path)
+        git_repo.git.commit("--allow-empty", "-m", message)
+        return git_repo.head.commit
+
+    return _commit
@@ -1,4 +1,5 @@
 from gitstory.read_key.read_key import read_key
+from unittest.mock import patch
 import os
 import pytest
 import shutil
@@ -42,6 +43,29 @@ class TestReadKey:
         with pytest.raises(ValueError):
             read_key(test_cwd)
 
+    def test_empty_read(self, key_file, test_cwd):
+        with pytest.raises(ValueError):
+            read_key(test_cwd)
+
+    def test_cached_read(self, key_file, test_cwd):
+        f = open(key_file, "w")
+        f.write("cached")
+        f.close()
+        assert read_key(test_cwd) == "cached"
+        with patch("builtins.open") as mock_open:
+            assert read_key(test_cwd) == "cached"
+        mock_open.assert_not_called()
+
+    def test_changed_key_reread(self, key_file, test_cwd):
+        f = open(key_file, "w")
+        f.write("old")
+        f.close()
+        assert read_key(test_cwd) == "old"
+        f = open(key_file, "w")
+        f.write("newer")
+        f.close()
+        assert read_key(test_cwd) == "newer"
+
     def test_no_read(self, test_cwd):
         assert not os.path.isfile(test_cwd + "/data/key.txt")
         with pytest.raises(FileNotFoundError):
@@ -1,5 +1,8 @@
+from unittest.mock import patch
+
 from click.testing import CliRunner
 from gitstory.__main__ import cli
+from gitstory.cli._common import SEPARATOR, echo_summary, report_error
 
 
 class TestMain:
@@ -57,10 +60,71 @@ class TestMain:
             or "Error: " in result.output
         )
 
+    def test_lazy_group_lists_commands(self):
+        """Test every subcommand is listed without being invoked."""
+        assert cli.list_commands(None) == [
+            "compare",
+            "dashboard",
+            "key",
+            "run",
+            "since",
+        ]
+
+    def test_lazy_group_resolves_commands(self):
+        """Test subcommands are loaded by name and unknown names are rejected."""
+        assert cli.get_command(None, "key").name == "key"
+        assert cli.get_command(None, "nope") is None
+
+        result = CliRunner().invoke(cli, ["nope"])
+        assert result.exit_code == 2
+
+    def test_report_error_known_hint(self, capsys):
+        """Test known error kinds map to their actionable hint."""
+        report_error("Rate Limit exceeded after multiple retries.")
+
+        err = capsys.readouterr().err
+        assert "API rate limit exceeded" in err
+        assert "Details" not in err
+
+    def test_report_error_first_match_wins(self, capsys):
+        """Test the earliest matching hint is used when several apply."""
+        report_error("Received empty response: incomplete")
+
+        err = capsys.readouterr().err
+        assert "empty response after 3 attempts" in err
+        assert "incomplete after 3 attempts" not in err
+
+    def test_report_error_unknown_shows_details(self, capsys):
+        """Test unknown errors are echoed verbatim."""
+        report_error("Something odd")
+
+        assert capsys.readouterr().err == "   Details: Something odd\n"
 
-"""
-NOTE:
-test_main_key doesn't exist because I (Derick) am currently
-unaware of a way to run such a test without destroying
-the key currently at the file location
-"""
+    def test_main_key_writes_key_file(self, monkeypatch, tmp_path):
+        """Test key command creates the data directory and stores the key."""
+        import gitstory.cli.key as key_module
+
+        key_path = tmp_path / "data" / "key.txt"
+        monkeypatch.setattr(key_module, "KEY_PATH", key_path)
+
+        result = CliRunner().invoke(cli, ["key", "--key", "abc123"])
+
+        assert result.exit_code == 0
+        assert key_path.read_text() == "abc123"
+        assert str(key_path) in result.output
+
+    def test_report_error_single_write(self):
+        """Test multi-line hints are written to stderr as one block."""
+        with patch("click.echo") as mock_echo:
+            report_error("Incomplete response: missing end marker")
+
+        mock_echo.assert_called_once()
+        assert "   - API timeout" in mock_echo.call_args[0][0]
+
+    def test_echo_summary_layout(self, capsys):
+        """Test the summary is framed by separators with trailing blank lines."""
+        echo_summary("Summary text")
+
+        assert capsys.readouterr().out == (
+            f"\n{SEPARATOR}\nSummary text\n{SEPARATOR}\n\n\n"
+        )
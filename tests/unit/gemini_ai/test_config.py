@@ -0,0 +1,35 @@
+"""
+Tests for Config loading from environment variables.
+"""
+
+import pytest
+from gitstory.gemini_ai.Config import Config
+
+
+def test_load_reads_api_key_and_default_model(monkeypatch):
+    """Test load uses the API key and falls back to the default model."""
+    monkeypatch.setenv("GITSTORY_API_KEY", "test-key")
+    monkeypatch.delenv("GITSTORY_LLM_MODEL", raising=False)
+
+    config = Config.load()
+
+    assert config.api_key == "test-key"
+    assert config.model == Config.DEFAULT_MODEL
+
+
+def test_load_reads_model_override(monkeypatch):
+    """Test load honours the GITSTORY_LLM_MODEL override."""
+    monkeypatch.setenv("GITSTORY_API_KEY", "test-key")
+    monkeypatch.setenv("GITSTORY_LLM_MODEL", "gemini-2.5-flash")
+
+    assert Config.load().model == "gemini-2.5-flash"
+
+
+def test_load_missing_api_key_exits(monkeypatch, capsys):
+    """Test load names the missing variable and exits."""
+    monkeypatch.delenv("GITSTORY_API_KEY", raising=False)
+
+    with pytest.raises(SystemExit):
+        Config.load()
+
+    assert "GITSTORY_API_KEY" in capsys.readouterr().out
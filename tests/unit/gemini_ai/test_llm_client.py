@@ -2,9 +2,31 @@
 Tests for LLM client (Gemini API integration).
 """
 
+import json
 import pytest
-from unittest.mock import Mock, patch
-from gitstory.gemini_ai.llm_client import LLMClient
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock, patch
+from gitstory.gemini_ai import llm_client as llm_client_module
+from gitstory.gemini_ai.llm_client import LLMClient, SummarizationError
+
+
+@pytest.fixture(autouse=True)
+def stdlib_json(monkeypatch):
+    """Decode through response.json() so mocked responses behave the same with or
+    without orjson installed."""
+    monkeypatch.setattr(llm_client_module, "orjson", None)
+
+
+@pytest.fixture
+def fake_orjson(monkeypatch):
+    """Stand in for orjson to exercise the fast decoding path."""
+    fake = SimpleNamespace(
+        loads=json.loads,
+        dumps=lambda obj: json.dumps(obj).encode("utf-8"),
+        JSONDecodeError=json.JSONDecodeError,
+    )
+    monkeypatch.setattr(llm_client_module, "orjson", fake)
+    return fake
 
 
 @pytest.fixture
@@ -31,7 +53,7 @@ def test_init(llm_client):
 
 def test_generate_success(llm_client, mock_success_response):
     """Test successful API call."""
-    with patch("requests.post") as mock_post:
+    with patch.object(llm_client.session, "post") as mock_post:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = mock_success_response
@@ -41,12 +63,13 @@ def test_generate_success(llm_client, mock_success_response):
 
         assert result == mock_success_response
         assert mock_post.called
-        assert "key=test-api-key" in mock_post.call_args[0][0]
+        assert mock_post.call_args[0][0] == llm_client.endpoint
+        assert mock_post.call_args[1]["headers"]["x-goog-api-key"] == "test-api-key"
 
 
 def test_generate_with_temperature(llm_client, mock_success_response):
     """Test API call with custom temperature."""
-    with patch("requests.post") as mock_post:
+    with patch.object(llm_client.session, "post") as mock_post:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = mock_success_response
@@ -55,13 +78,13 @@ def test_generate_with_temperature(llm_client, mock_success_response):
         llm_client.generate("test prompt", temperature=0.5)
 
         call_args = mock_post.call_args
-        payload = call_args[1]["json"]
+        payload = json.loads(call_args[1]["data"])
         assert payload["generationConfig"]["temperature"] == 0.5
 
 
 def test_generate_invalid_api_key(llm_client):
     """Test handling of invalid API key."""
-    with patch("requests.post") as mock_post:
+    with patch.object(llm_client.session, "post") as mock_post:
         mock_response = Mock()
         mock_response.status_code = 401
         mock_post.return_value = mock_response
@@ -74,7 +97,7 @@ def test_generate_invalid_api_key(llm_client):
 
 def test_generate_rate_limit_retry(llm_client, mock_success_response):
     """Test retry logic for rate limiting."""
-    with patch("requests.post") as mock_post, patch("time.sleep"):
+    with patch.object(llm_client.session, "post") as mock_post, patch("time.sleep"):
         # First call returns 429, second call succeeds
         mock_response_429 = Mock()
         mock_response_429.status_code = 429
@@ -93,7 +116,7 @@ def test_generate_rate_limit_retry(llm_client, mock_success_response):
 
 def test_generate_rate_limit_max_retries(llm_client):
     """Test rate limit exceeding max retries."""
-    with patch("requests.post") as mock_post, patch("time.sleep"):
+    with patch.object(llm_client.session, "post") as mock_post, patch("time.sleep"):
         mock_response = Mock()
         mock_response.status_code = 429
         mock_post.return_value = mock_response
@@ -107,7 +130,7 @@ def test_generate_rate_limit_max_retries(llm_client):
 
 def test_generate_timeout_retry(llm_client, mock_success_response):
     """Test retry logic for timeouts."""
-    with patch("requests.post") as mock_post, patch("time.sleep"):
+    with patch.object(llm_client.session, "post") as mock_post, patch("time.sleep"):
         from requests.exceptions import Timeout
 
         # First call times out, second call succeeds
@@ -125,7 +148,7 @@ def test_generate_timeout_retry(llm_client, mock_success_response):
 
 def test_generate_timeout_max_retries(llm_client):
     """Test timeout exceeding max retries."""
-    with patch("requests.post") as mock_post, patch("time.sleep"):
+    with patch.object(llm_client.session, "post") as mock_post, patch("time.sleep"):
         from requests.exceptions import Timeout
 
         mock_post.side_effect = Timeout()
@@ -137,30 +160,6 @@ def test_generate_timeout_max_retries(llm_client):
         assert mock_post.call_count == 3
 
 
-def test_validate_api_key_success(llm_client):
-    """Test API key validation success."""
-    with patch("requests.post") as mock_post:
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_post.return_value = mock_response
-
-        result = llm_client.validate_api_key()
-
-        assert result is True
-
-
-def test_validate_api_key_failure(llm_client):
-    """Test API key validation failure."""
-    with patch("requests.post") as mock_post:
-        mock_response = Mock()
-        mock_response.status_code = 401
-        mock_post.return_value = mock_response
-
-        result = llm_client.validate_api_key()
-
-        assert result is False
-
-
 def test_extract_error():
     """Test error message extraction."""
     client = LLMClient("test-key")
@@ -189,7 +188,7 @@ def test_generate_retries_on_empty_json(
     llm_client, mock_gemini_empty_json_response, mock_success_response
 ):
     """Test retry logic for empty JSON response."""
-    with patch("requests.post") as mock_post, patch("time.sleep"):
+    with patch.object(llm_client.session, "post") as mock_post, patch("time.sleep"):
         # First call returns empty JSON, second call succeeds
         mock_response_empty = Mock()
         mock_response_empty.status_code = 200
@@ -211,7 +210,7 @@ def test_generate_retries_on_empty_candidates(
     llm_client, mock_gemini_empty_candidates_response, mock_success_response
 ):
     """Test retry logic for empty candidates array."""
-    with patch("requests.post") as mock_post, patch("time.sleep"):
+    with patch.object(llm_client.session, "post") as mock_post, patch("time.sleep"):
         # First call returns empty candidates, second call succeeds
         mock_response_empty = Mock()
         mock_response_empty.status_code = 200
@@ -233,7 +232,7 @@ def test_generate_fails_after_max_retries_empty(
     llm_client, mock_gemini_empty_json_response
 ):
     """Test that empty JSON response raises error after max retries."""
-    with patch("requests.post") as mock_post, patch("time.sleep"):
+    with patch.object(llm_client.session, "post") as mock_post, patch("time.sleep"):
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = mock_gemini_empty_json_response
@@ -250,7 +249,7 @@ def test_generate_fails_after_max_retries_empty_candidates(
     llm_client, mock_gemini_empty_candidates_response
 ):
     """Test that empty candidates raises error after max retries."""
-    with patch("requests.post") as mock_post, patch("time.sleep"):
+    with patch.object(llm_client.session, "post") as mock_post, patch("time.sleep"):
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = mock_gemini_empty_candidates_response
@@ -265,7 +264,7 @@ def test_generate_fails_after_max_retries_empty_candidates(
 
 def test_generate_validates_candidate_structure(llm_client):
     """Test that malformed candidate structure is caught."""
-    with patch("requests.post") as mock_post, patch("time.sleep"):
+    with patch.object(llm_client.session, "post") as mock_post, patch("time.sleep"):
         # Response with candidates but malformed structure
         malformed_response = {"candidates": ["not a dict"]}
 
@@ -279,3 +278,200 @@ def test_generate_validates_candidate_structure(llm_client):
 
         assert "malformed candidate structure" in str(exc_info.value)
         assert mock_post.call_count == 3
+
+
+def test_backoff_honors_retry_after_seconds(llm_client):
+    """Test that a numeric Retry-After header sets the retry delay."""
+    mock_response = Mock()
+    mock_response.headers = {"Retry-After": "3"}
+
+    assert llm_client._compute_backoff(mock_response, 1) == 3.0
+
+
+def test_backoff_honors_retry_after_http_date(llm_client):
+    """Test that an HTTP-date Retry-After header is converted to seconds."""
+    mock_response = Mock()
+    mock_response.headers = {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}
+
+    # Date is in the past, so there is nothing left to wait for
+    assert llm_client._compute_backoff(mock_response, 1) == 0.0
+
+
+def test_backoff_honors_rate_limit_reset(llm_client):
+    """Test that X-RateLimit-Reset is used when Retry-After is absent."""
+    mock_response = Mock()
+    mock_response.headers = {"X-RateLimit-Reset": "7"}
+
+    assert llm_client._compute_backoff(mock_response, 1) == 7.0
+
+
+def test_backoff_honors_body_retry_delay(llm_client):
+    """Test that Gemini's RetryInfo retryDelay is used when no header is set."""
+    mock_response = Mock()
+    mock_response.headers = {}
+    mock_response.json.return_value = {
+        "error": {
+            "code": 429,
+            "details": [
+                {"@type": "type.googleapis.com/google.rpc.QuotaFailure"},
+                {
+                    "@type": "type.googleapis.com/google.rpc.RetryInfo",
+                    "retryDelay": "7s",
+                },
+            ],
+        }
+    }
+
+    assert llm_client._compute_backoff(mock_response, 1) == 7.0
+
+
+def test_backoff_ignores_unparseable_body(llm_client):
+    """Test that a body without retryDelay falls back to exponential backoff."""
+    mock_response = Mock()
+    mock_response.headers = {}
+    mock_response.json.side_effect = ValueError("not json")
+
+    with patch("random.uniform", return_value=0.5):
+        assert llm_client._compute_backoff(mock_response, 1) == 1.5
+
+
+def test_backoff_caps_server_advice(llm_client):
+    """Test that absurd server-advised delays are bounded."""
+    mock_response = Mock()
+    mock_response.headers = {"Retry-After": "86400"}
+
+    assert (
+        llm_client._compute_backoff(mock_response, 1)
+        == llm_client.MAX_ADVISED_DELAY_SECONDS
+    )
+
+
+def test_backoff_exponential_with_jitter(llm_client):
+    """Test exponential growth, cap, and jitter of the fallback delay."""
+    with patch("random.uniform", return_value=0.5):
+        assert llm_client._compute_backoff(None, 1) == 1.5
+        assert llm_client._compute_backoff(None, 2) == 2.5
+        assert llm_client._compute_backoff(None, 3) == 4.5
+        assert llm_client._compute_backoff(None, 10) == 30.5
+
+
+def test_generate_retries_on_service_unavailable(llm_client, mock_success_response):
+    """Test that HTTP 503 is retried using the server's Retry-After."""
+    with (
+        patch.object(llm_client.session, "post") as mock_post,
+        patch("time.sleep") as mock_sleep,
+    ):
+        mock_response_503 = Mock()
+        mock_response_503.status_code = 503
+        mock_response_503.headers = {"Retry-After": "2"}
+
+        mock_response_200 = Mock()
+        mock_response_200.status_code = 200
+        mock_response_200.json.return_value = mock_success_response
+
+        mock_post.side_effect = [mock_response_503, mock_response_200]
+
+        result = llm_client.generate("test prompt")
+
+        assert result == mock_success_response
+        mock_sleep.assert_called_once_with(2.0)
+
+
+def test_session_reused_across_calls(llm_client, mock_success_response):
+    """Test that successive calls share one pooled session."""
+    with patch.object(llm_client.session, "post") as mock_post:
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = mock_success_response
+        mock_post.return_value = mock_response
+
+        llm_client.generate("first prompt")
+        llm_client.generate("second prompt")
+
+        assert mock_post.call_count == 2
+
+
+def test_context_manager_closes_session():
+    """Test that leaving the context manager closes the session."""
+    client = LLMClient(api_key="test-api-key")
+    with patch.object(client.session, "close") as mock_close:
+        with client as entered:
+            assert entered is client
+            mock_close.assert_not_called()
+        mock_close.assert_called_once()
+
+
+def test_encode_json_without_orjson(monkeypatch):
+    """Test the stdlib fallback produces compact UTF-8 JSON."""
+    monkeypatch.setattr(llm_client_module, "orjson", None)
+
+    body = llm_client_module._encode_json({"text": "héllo", "n": [1, 2]})
+
+    assert isinstance(body, bytes)
+    assert json.loads(body) == {"text": "héllo", "n": [1, 2]}
+    assert b" " not in body
+
+
+def test_stream_yields_sse_text_chunks(llm_client):
+    """Test server-sent event lines are decoded into text chunks."""
+    lines = [
+        'data: {"candidates": [{"content": {"parts": [{"text": "Hello "}]}}]}',
+        "",
+        ": keep-alive",
+        'data: {"candidates": [{"content": {"parts": [{"text": "world"}]}}]}',
+    ]
+    with patch.object(llm_client.session, "post") as mock_post:
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.iter_lines.return_value = iter(lines)
+        mock_response.__enter__.return_value = mock_response
+        mock_post.return_value = mock_response
+
+        chunks = list(llm_client.stream("test prompt"))
+
+        assert chunks == ["Hello ", "world"]
+        assert ":streamGenerateContent?alt=sse" in mock_post.call_args[0][0]
+        assert mock_post.call_args[1]["stream"] is True
+
+
+def test_stream_http_error(llm_client):
+    """Test streaming surfaces HTTP errors without retrying."""
+    with patch.object(llm_client.session, "post") as mock_post:
+        mock_response = MagicMock()
+        mock_response.status_code = 500
+        mock_response.json.return_value = {"error": {"message": "boom"}}
+        mock_post.return_value = mock_response
+
+        with pytest.raises(SummarizationError, match="boom"):
+            list(llm_client.stream("test prompt"))
+        assert mock_post.call_count == 1
+
+
+def test_generate_decodes_body_with_orjson(
+    llm_client, mock_success_response, fake_orjson
+):
+    """Test the raw body is decoded with orjson when it is available."""
+    with patch.object(llm_client.session, "post") as mock_post:
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps(mock_success_response).encode("utf-8")
+        mock_post.return_value = mock_response
+
+        assert llm_client.generate("test prompt") == mock_success_response
+        mock_response.json.assert_not_called()
+
+
+def test_generate_retries_invalid_json_with_orjson(
+    llm_client, mock_success_response, fake_orjson
+):
+    """Test an undecodable body is retried like a request error."""
+    with patch.object(llm_client.session, "post") as mock_post, patch("time.sleep"):
+        bad_response = Mock(status_code=200, content=b"not json")
+        good_response = Mock(
+            status_code=200,
+            content=json.dumps(mock_success_response).encode("utf-8"),
+        )
+        mock_post.side_effect = [bad_response, good_response]
+
+        assert llm_client.generate("test prompt") == mock_success_response
+        assert mock_post.call_count == 2
@@ -104,6 +104,16 @@ def test_format_data(prompt_engine, sample_parsed_data):
     assert "BUGFIX COMMITS" in formatted
 
 
+def test_build_prompt_is_header_plus_data(prompt_engine, sample_parsed_data):
+    """Test the system prompt is prepended to the formatted data unchanged."""
+    prompt = prompt_engine.build_prompt(sample_parsed_data, "cli")
+
+    assert prompt == (
+        f"{prompt_engine.CLI_SYSTEM_PROMPT}\n\n"
+        + prompt_engine._format_data(sample_parsed_data)
+    )
+
+
 def test_format_data_with_empty_commits(prompt_engine):
     """Test formatting with no commits."""
     empty_data = {
@@ -0,0 +1,142 @@
+"""
+Tests for the on-disk response cache.
+"""
+
+import json
+import os
+import sys
+from unittest.mock import Mock
+
+import pytest
+from gitstory.gemini_ai.response_cache import ResponseCache, SemanticResponseCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create an enabled cache rooted in a temporary directory."""
+    return ResponseCache(str(tmp_path), enabled=True)
+
+
+@pytest.fixture
+def raw_response():
+    """Minimal raw Gemini response."""
+    return {
+        "candidates": [{"content": {"parts": [{"text": "Summary\n[END-SUMMARY]"}]}}],
+        "usageMetadata": {"totalTokenCount": 42},
+    }
+
+
+def test_disabled_by_default(monkeypatch, tmp_path):
+    """Test that the cache is opt-in via environment variable."""
+    monkeypatch.delenv(ResponseCache.ENABLE_ENV_VAR, raising=False)
+    assert ResponseCache(str(tmp_path)).enabled is False
+
+    monkeypatch.setenv(ResponseCache.ENABLE_ENV_VAR, "1")
+    assert ResponseCache(str(tmp_path)).enabled is True
+
+
+def test_get_miss(cache):
+    """Test that a missing key returns None."""
+    assert cache.get("missing") is None
+
+
+def test_set_then_get(cache, raw_response):
+    """Test round-tripping a response through the cache."""
+    cache.set("key", raw_response)
+    assert cache.get("key") == raw_response
+
+
+def test_disabled_cache_is_noop(tmp_path, raw_response):
+    """Test that a disabled cache neither reads nor writes."""
+    cache = ResponseCache(str(tmp_path), enabled=False)
+    cache.set("key", raw_response)
+
+    assert cache.get("key") is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_expired_entry_is_evicted(tmp_path, raw_response):
+    """Test that entries older than the TTL are removed on lookup."""
+    cache = ResponseCache(str(tmp_path), ttl_seconds=60, enabled=True)
+    with open(tmp_path / "key.json", "w", encoding="utf-8") as cache_file:
+        json.dump({"raw": raw_response, "ts": 0}, cache_file)
+
+    assert cache.get("key") is None
+    assert not os.path.exists(tmp_path / "key.json")
+
+
+def test_corrupt_entry_is_a_miss(cache, tmp_path):
+    """Test that unreadable cache files are treated as misses."""
+    (tmp_path / "key.json").write_text("{not json", encoding="utf-8")
+    assert cache.get("key") is None
+
+
+def test_set_leaves_no_temp_files(cache, tmp_path, raw_response):
+    """Test that atomic writes clean up after themselves."""
+    cache.set("key", raw_response)
+    assert [p.name for p in tmp_path.iterdir()] == ["key.json"]
+
+
+class FakeEncoder:
+    """Maps known prompts to fixed unit vectors."""
+
+    VECTORS = {
+        "prompt a": [1.0, 0.0],
+        "prompt a'": [0.99, 0.141],
+        "prompt b": [0.0, 1.0],
+    }
+
+    def encode(self, prompt, normalize_embeddings=False):
+        vector = Mock()
+        vector.tolist.return_value = self.VECTORS[prompt]
+        return vector
+
+
+@pytest.fixture
+def semantic_cache(tmp_path):
+    """Create an enabled semantic cache with a fake embedding model."""
+    cache = SemanticResponseCache(str(tmp_path), enabled=True, threshold=0.98)
+    cache._model = FakeEncoder()
+    return cache
+
+
+def test_semantic_disabled_by_default(monkeypatch, tmp_path):
+    """Test that the semantic cache is opt-in via environment variable."""
+    monkeypatch.delenv(SemanticResponseCache.ENABLE_ENV_VAR, raising=False)
+    cache = SemanticResponseCache(str(tmp_path))
+
+    assert cache.enabled is False
+    assert cache.get("scope", "prompt a") is None
+
+
+def test_semantic_threshold_from_env(monkeypatch, tmp_path):
+    """Test that the similarity threshold can be configured."""
+    monkeypatch.setenv(SemanticResponseCache.THRESHOLD_ENV_VAR, "0.9")
+    assert SemanticResponseCache(str(tmp_path)).threshold == 0.9
+
+
+def test_semantic_disables_without_model_package(monkeypatch, tmp_path):
+    """Test graceful degradation when sentence-transformers is missing."""
+    monkeypatch.setitem(sys.modules, "sentence_transformers", None)
+    cache = SemanticResponseCache(str(tmp_path), enabled=True)
+
+    assert cache.get("scope", "prompt a") is None
+    assert cache.enabled is False
+
+
+def test_semantic_near_match_hit(semantic_cache, raw_response):
+    """Test that a near-identical prompt reuses the cached response."""
+    semantic_cache.add("scope", "prompt a", raw_response)
+    assert semantic_cache.get("scope", "prompt a'") == raw_response
+
+
+def test_semantic_dissimilar_prompt_misses(semantic_cache, raw_response):
+    """Test that unrelated prompts never hit."""
+    semantic_cache.add("scope", "prompt a", raw_response)
+    assert semantic_cache.get("scope", "prompt b") is None
+
+
+def test_semantic_scope_isolation(semantic_cache, raw_response):
+    """Test that entries from another model/temperature are ignored."""
+    semantic_cache.add("gemini-2.5-pro|0.7", "prompt a", raw_response)
+    assert semantic_cache.get("gemini-2.5-pro|0.2", "prompt a") is None
@@ -3,6 +3,9 @@ Tests for response handler.
 """
 
 import pytest
+from unittest.mock import patch
+
+from gitstory.gemini_ai import response_handler as response_handler_module
 from gitstory.gemini_ai.response_handler import ResponseHandler
 
 
@@ -75,6 +78,32 @@ def test_clean_content_removes_excessive_newlines(response_handler):
     assert "Line 1\n\nLine 2" in cleaned
 
 
+def test_clean_content_collapses_newlines_around_fences(response_handler):
+    """Test newlines joined by removed fences are collapsed too."""
+    content = "Intro\n\n```\n\n\nBody\n```text```\n\n\nEnd"
+    cleaned = response_handler._clean_content(content)
+
+    assert cleaned == "Intro\n\nBody\ntext\n\nEnd"
+
+
+def test_clean_content_fast_path_skips_regex(response_handler):
+    """Test content without fences or blank runs bypasses the regex pass."""
+    with patch.object(response_handler_module, "_CLEAN_RE") as mock_re:
+        cleaned = response_handler._clean_content("  Line 1\n\nLine 2  ")
+
+    assert cleaned == "Line 1\n\nLine 2"
+    mock_re.sub.assert_not_called()
+
+
+def test_format_for_cli_without_headings_skips_regex(response_handler):
+    """Test heading spacing is skipped for content without any headings."""
+    with patch.object(response_handler_module, "_HEADING_RE") as mock_re:
+        formatted = response_handler._format_for_cli("  Plain text\nMore  ")
+
+    assert formatted == "Plain text\nMore"
+    mock_re.sub.assert_not_called()
+
+
 def test_clean_content_strips_whitespace(response_handler):
     """Test whitespace stripping."""
     content = "  \n  Content with whitespace  \n  "
@@ -92,13 +121,32 @@ def test_format_for_cli(response_handler):
     assert "\n\n#" in formatted or formatted.startswith("#")
 
 
-def test_format_for_dashboard(response_handler):
-    """Test dashboard formatting (minimal processing)."""
-    content = "# Header\nContent"
-    formatted = response_handler._format_for_dashboard(content)
+def test_process_dashboard_leaves_content_as_is(response_handler):
+    """Test dashboard output is only cleaned, without CLI heading reflow."""
+    content = "# Header\nContent long enough to pass validation\n[END-SUMMARY]"
+    response = {"candidates": [{"content": {"parts": [{"text": content}]}}]}
+
+    formatted = response_handler.process(response, "dashboard")
 
-    # Dashboard formatting is minimal
-    assert formatted == content
+    assert formatted == "# Header\nContent long enough to pass validation"
+
+
+def test_process_invalid_response_logs_at_debug(response_handler, caplog, capsys):
+    """Test the raw payload of a malformed response goes to the debug log only."""
+    with caplog.at_level("DEBUG", logger="gitstory.gemini_ai.response_handler"):
+        with pytest.raises(ValueError, match="Invalid API response format"):
+            response_handler.process({"candidates": [None]}, "cli")
+
+    assert "Raw API response" in caplog.text
+    assert capsys.readouterr().out == ""
+
+
+def test_process_and_count(response_handler, mock_gemini_response):
+    """Test formatted text and token usage are returned together."""
+    text, tokens = response_handler.process_and_count(mock_gemini_response, "cli")
+
+    assert text == response_handler.process(mock_gemini_response, "cli")
+    assert tokens == response_handler.get_token_usage(mock_gemini_response)
 
 
 def test_extract_error_message_dict(response_handler):
@@ -149,6 +197,17 @@ def test_get_token_usage_invalid_structure(response_handler):
     assert tokens == 0
 
 
+def test_get_cached_token_usage(response_handler):
+    """Test cached prompt tokens are read from usage metadata."""
+    response = {
+        "usageMetadata": {"totalTokenCount": 250, "cachedContentTokenCount": 120}
+    }
+
+    assert response_handler.get_cached_token_usage(response) == 120
+    assert response_handler.get_cached_token_usage({"usageMetadata": {}}) == 0
+    assert response_handler.get_cached_token_usage({"usageMetadata": "bad"}) == 0
+
+
 def test_process_cli_format(response_handler, mock_gemini_response):
     """Test processing for CLI output format."""
     result = response_handler.process(mock_gemini_response, "cli")
@@ -5,12 +5,17 @@ Integration tests for AISummarizer.
 import pytest
 from unittest.mock import patch
 from gitstory.gemini_ai import AISummarizer
+from gitstory.gemini_ai.llm_client import SummarizationError
 
 
 @pytest.fixture
 def summarizer():
     """Create AI summarizer for testing."""
-    return AISummarizer(api_key="test-api-key", model="gemini-2.5-pro")
+    summarizer = AISummarizer(api_key="test-api-key", model="gemini-2.5-pro")
+    # Never touch the user's response caches
+    summarizer.cache.enabled = False
+    summarizer.semantic_cache.enabled = False
+    return summarizer
 
 
 @pytest.fixture
@@ -109,6 +114,23 @@ def test_summarize_api_error(summarizer, sample_parsed_data):
         assert result["metadata"] == {}
 
 
+def test_summarize_llm_error_short_circuits(summarizer, sample_parsed_data):
+    """Test an LLM client failure returns at once without processing or retrying."""
+    with (
+        patch.object(
+            summarizer.client,
+            "generate",
+            side_effect=SummarizationError("Rate limit exceeded"),
+        ) as mock_generate,
+        patch.object(summarizer.response_handler, "process") as mock_process,
+    ):
+        result = summarizer.summarize(sample_parsed_data, output_format="cli")
+
+    assert result == {"summary": None, "metadata": {}, "error": "Rate limit exceeded"}
+    mock_generate.assert_called_once()
+    mock_process.assert_not_called()
+
+
 def test_summarize_invalid_response(summarizer, sample_parsed_data):
     """Test handling of invalid API response."""
     invalid_response = {"invalid": "structure"}
@@ -157,10 +179,22 @@ def test_summarize_extracts_token_usage(
         result = summarizer.summarize(sample_parsed_data, output_format="cli")
 
         assert result["metadata"]["tokens_used"] == 150
+        assert result["metadata"]["cached_tokens"] == 0
+
+
+def test_summarize_reports_cached_tokens(
+    summarizer, sample_parsed_data, mock_api_response
+):
+    """Test that Gemini's cached prompt token count is surfaced in metadata."""
+    mock_api_response["usageMetadata"]["cachedContentTokenCount"] = 90
+    with patch.object(summarizer.client, "generate", return_value=mock_api_response):
+        result = summarizer.summarize(sample_parsed_data, output_format="cli")
+
+    assert result["metadata"]["cached_tokens"] == 90
 
 
 def test_summarize_with_zero_commits(summarizer):
-    """Test summarization with empty commit data."""
+    """Test an empty range is answered locally without calling Gemini."""
     empty_data = {
         "commits": [],
         "summary_text": "",
@@ -168,26 +202,47 @@ def test_summarize_with_zero_commits(summarizer):
         "metadata": {},
     }
 
-    mock_response = {
-        "candidates": [
-            {
-                "content": {
-                    "parts": [
-                        {
-                            "text": "No commits found in this repository.\n\n[END-SUMMARY]"
-                        }
-                    ]
-                }
-            }
-        ],
-        "usageMetadata": {"totalTokenCount": 10},
-    }
-
-    with patch.object(summarizer.client, "generate", return_value=mock_response):
+    with patch.object(summarizer.client, "generate") as mock_generate:
         result = summarizer.summarize(empty_data, output_format="cli")
 
         assert result["error"] is None
+        assert result["summary"] == summarizer.NO_COMMITS_SUMMARY
         assert result["metadata"]["commits_analyzed"] == 0
+        assert result["metadata"]["tokens_used"] == 0
+        mock_generate.assert_not_called()
+
+
+def test_summarize_stream_with_zero_commits(summarizer):
+    """Test streaming an empty range yields the local summary only."""
+    empty_data = {"commits": [], "stats": {"total_commits": 0}}
+
+    with patch.object(summarizer.client, "stream") as mock_stream:
+        chunks = list(summarizer.summarize_stream(empty_data))
+
+    assert chunks == [summarizer.NO_COMMITS_SUMMARY]
+    mock_stream.assert_not_called()
+
+
+def test_summarize_comparison_without_divergence(summarizer):
+    """Test branches with no commits since the merge base skip the API call."""
+    comparison_data = {
+        "base_branch": "main",
+        "compare_branch": "feature",
+        "merge_base": {"hash": "abc123"},
+        "divergence_metrics": {
+            "time_since_divergence": "0 days",
+            "base_commit_count": 0,
+            "compare_commit_count": 0,
+        },
+    }
+
+    with patch.object(summarizer.client, "generate") as mock_generate:
+        result = summarizer.summarize_comparison(comparison_data)
+
+    assert result["summary"] == summarizer.NO_DIVERGENCE_SUMMARY
+    assert result["metadata"]["merge_base"] == "abc123"
+    assert result["metadata"]["tokens_used"] == 0
+    mock_generate.assert_not_called()
 
 
 def test_summarize_default_output_format(
@@ -352,9 +407,162 @@ def test_summarize_retry_delay(
             ],
         ),
         patch("time.sleep") as mock_sleep,
+        patch("random.uniform", return_value=0.25),
     ):
         result = summarizer.summarize(sample_parsed_data, output_format="cli")
 
-        # Should have called sleep with retry delay
-        mock_sleep.assert_called_once_with(summarizer.RETRY_DELAY_SECONDS)
+        # Should have called sleep with the first backoff step plus jitter
+        mock_sleep.assert_called_once_with(summarizer.RETRY_DELAY_SECONDS + 0.25)
         assert result["error"] is None
+
+
+def test_retry_delay_backs_off_exponentially(summarizer):
+    """Test content retry delays double per attempt up to the cap."""
+    with patch("random.uniform", return_value=0.0):
+        assert summarizer._retry_delay(1) == 5
+        assert summarizer._retry_delay(2) == 10
+        assert summarizer._retry_delay(3) == 20
+        assert summarizer._retry_delay(4) == summarizer.RETRY_DELAY_CAP_SECONDS
+
+
+def test_summarize_uses_cached_response(
+    summarizer, sample_parsed_data, mock_api_response, tmp_path
+):
+    """Test that a cached response skips the API call on the next run."""
+    summarizer.cache.cache_dir = str(tmp_path)
+    summarizer.cache.enabled = True
+
+    with patch.object(
+        summarizer.client, "generate", return_value=mock_api_response
+    ) as mock_generate:
+        first = summarizer.summarize(sample_parsed_data, output_format="cli")
+        second = summarizer.summarize(sample_parsed_data, output_format="cli")
+
+    assert mock_generate.call_count == 1
+    assert first == second
+
+
+def test_no_cache_overrides_environment(monkeypatch):
+    """Test use_cache=False disables both caches even when enabled by env."""
+    monkeypatch.setenv("GITSTORY_LLM_CACHE", "1")
+    monkeypatch.setenv("GITSTORY_LLM_SEMANTIC_CACHE", "1")
+
+    summarizer = AISummarizer(api_key="test-api-key", use_cache=False)
+
+    assert summarizer.cache.enabled is False
+    assert summarizer.semantic_cache.enabled is False
+
+
+def test_summarize_does_not_cache_invalid_response(
+    summarizer, sample_parsed_data, mock_gemini_incomplete_response, tmp_path
+):
+    """Test that responses failing validation are never written to the cache."""
+    summarizer.cache.cache_dir = str(tmp_path)
+    summarizer.cache.enabled = True
+
+    with (
+        patch.object(
+            summarizer.client, "generate", return_value=mock_gemini_incomplete_response
+        ),
+        patch("time.sleep"),
+    ):
+        result = summarizer.summarize(sample_parsed_data, output_format="cli")
+
+    assert result["error"] is not None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_summarize_many_preserves_order(summarizer, sample_parsed_data):
+    """Test that concurrent summaries come back in input order."""
+    datasets = []
+    for index in range(5):
+        data = dict(sample_parsed_data)
+        data["summary_text"] = f"dataset-{index}"
+        datasets.append(data)
+
+    def mock_generate(prompt, **kwargs):
+        index = prompt.rsplit("dataset-", 1)[1]
+        return {
+            "candidates": [
+                {
+                    "content": {
+                        "parts": [
+                            {"text": f"Summary for dataset {index}\n\n[END-SUMMARY]"}
+                        ]
+                    }
+                }
+            ],
+            "usageMetadata": {"totalTokenCount": 10},
+        }
+
+    with patch.object(summarizer.client, "generate", side_effect=mock_generate):
+        results = summarizer.summarize_many(datasets)
+
+    assert [r["summary"] for r in results] == [
+        f"Summary for dataset {index}" for index in range(5)
+    ]
+
+
+def test_summarize_many_empty(summarizer):
+    """Test that an empty batch returns an empty list without API calls."""
+    with patch.object(summarizer.client, "generate") as mock_generate:
+        assert summarizer.summarize_many([]) == []
+        mock_generate.assert_not_called()
+
+
+def test_max_concurrency_from_env(summarizer, monkeypatch):
+    """Test that the concurrency limit is configurable and sanitized."""
+    monkeypatch.setenv(summarizer.CONCURRENCY_ENV_VAR, "2")
+    assert summarizer._max_concurrency() == 2
+
+    monkeypatch.setenv(summarizer.CONCURRENCY_ENV_VAR, "not-a-number")
+    assert summarizer._max_concurrency() == summarizer.DEFAULT_CONCURRENCY
+
+    monkeypatch.setenv(summarizer.CONCURRENCY_ENV_VAR, "0")
+    assert summarizer._max_concurrency() == 1
+
+
+def test_summarize_stream_strips_split_end_marker(summarizer, sample_parsed_data):
+    """Test streamed text is passed through and a split end marker is removed."""
+    chunks = ["## Overview\nThe team ", "shipped a feature.\n[END-", "SUMMARY]"]
+    with patch.object(
+        summarizer.client, "stream", return_value=(chunk for chunk in chunks)
+    ):
+        streamed = list(summarizer.summarize_stream(sample_parsed_data))
+
+    assert "".join(streamed) == "## Overview\nThe team shipped a feature.\n"
+    assert not any("[END" in chunk for chunk in streamed)
+
+
+def test_summarize_stream_missing_end_marker(summarizer, sample_parsed_data):
+    """Test a stream that ends without the marker reports an incomplete response."""
+    with patch.object(
+        summarizer.client, "stream", return_value=(chunk for chunk in ["Partial"])
+    ):
+        stream = summarizer.summarize_stream(sample_parsed_data)
+        assert next(stream) == "Partial"
+        with pytest.raises(SummarizationError, match="Incomplete response"):
+            next(stream)
+
+
+def test_summarize_stream_closes_client_stream_at_marker(
+    summarizer, sample_parsed_data
+):
+    """Test the Gemini stream is closed, not drained, once the end marker arrives."""
+    consumed = []
+    closed = []
+
+    def fake_stream(prompt, **kwargs):
+        try:
+            for chunk in ["Done\n[END-SUMMARY]", "trailing tokens"]:
+                consumed.append(chunk)
+                yield chunk
+        finally:
+            closed.append(True)
+
+    with patch.object(summarizer.client, "stream", side_effect=fake_stream):
+        streamed = list(summarizer.summarize_stream(sample_parsed_data))
+
+    assert "".join(streamed) == "Done\n"
+    assert consumed == ["Done\n[END-SUMMARY]"]
+    assert closed == [True]
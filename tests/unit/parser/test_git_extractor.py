@@ -14,7 +14,7 @@ Coverage Target: 95%+ branch coverage
 import pytest
 from unittest.mock import Mock, patch
 from datetime import datetime, timedelta
-from git import InvalidGitRepositoryError
+from git import GitCommandError, InvalidGitRepositoryError
 
 from gitstory.parser.git_extractor import GitExtractor
 
@@ -276,6 +276,7 @@ class TestGetCommitsFiltering:
         )
 
         mock_repo.iter_commits.return_value = [commit1, commit2]
+        mock_repo.git.log.return_value = b""  # no batched changes
         mock_repo_class.return_value = mock_repo
 
         extractor = GitExtractor("/fake/path")
@@ -303,6 +304,7 @@ class TestGetCommitsFiltering:
         )
 
         mock_repo.iter_commits.return_value = [commit1, commit2]
+        mock_repo.git.log.return_value = b""  # no batched changes
         mock_repo_class.return_value = mock_repo
 
         extractor = GitExtractor("/fake/path")
@@ -329,6 +331,7 @@ class TestGetCommitsFiltering:
         )
 
         mock_repo.iter_commits.return_value = [commit1, commit2]
+        mock_repo.git.log.return_value = b""  # no batched changes
         mock_repo_class.return_value = mock_repo
 
         extractor = GitExtractor("/fake/path")
@@ -358,6 +361,7 @@ class TestGetCommitsFiltering:
         )
 
         mock_repo.iter_commits.return_value = [commit1, commit2, commit3]
+        mock_repo.git.log.return_value = b""  # no batched changes
         mock_repo_class.return_value = mock_repo
 
         extractor = GitExtractor("/fake/path")
@@ -390,6 +394,7 @@ class TestGetCommitsFiltering:
         )
 
         mock_repo.iter_commits.return_value = [commit1]
+        mock_repo.git.log.return_value = b""  # no batched changes
         mock_repo_class.return_value = mock_repo
 
         extractor = GitExtractor("/fake/path")
@@ -418,6 +423,7 @@ class TestGetCommitsFiltering:
         )
 
         mock_repo.iter_commits.return_value = [commit1]
+        mock_repo.git.log.return_value = b""  # no batched changes
         mock_repo_class.return_value = mock_repo
 
         extractor = GitExtractor("/fake/path")
@@ -428,6 +434,25 @@ class TestGetCommitsFiltering:
         # Assert
         mock_repo.iter_commits.assert_called_once_with("main")
 
+    @patch("gitstory.parser.git_extractor.Repo")
+    def test_get_commits_passes_time_window_to_git(self, mock_repo_class):
+        """Test get_commits() lets git skip commits outside since/until."""
+        # Arrange
+        mock_repo = Mock()
+        mock_repo.active_branch.name = "main"
+        mock_repo.iter_commits.return_value = []
+        mock_repo_class.return_value = mock_repo
+
+        extractor = GitExtractor("/fake/path")
+
+        # Act
+        extractor.get_commits(since="2025-01-01", until="2025-02-01")
+
+        # Assert
+        mock_repo.iter_commits.assert_called_once_with(
+            "main", since="2025-01-01T00:00:00", until="2025-02-01T00:00:00"
+        )
+
     @patch("gitstory.parser.git_extractor.Repo")
     def test_get_commits_nonexistent_branch_raises_error(self, mock_repo_class):
         """Test get_commits() with nonexistent branch raises ValueError."""
@@ -615,6 +640,53 @@ class TestGetCommitDiff:
         assert "string diff" in result
 
 
+class TestDiffTruncation:
+    """Test suite for capping extracted diff text."""
+
+    @patch("gitstory.parser.git_extractor.Repo")
+    def test_get_commit_diff_truncates_at_cap(self, mock_repo_class):
+        """Test _get_commit_diff() stops reading diffs once max_diff_chars is hit."""
+        # Arrange
+        mock_repo_class.return_value = Mock()
+        extractor = GitExtractor("/fake/path", max_diff_chars=10)
+
+        commit = Mock()
+        parent = Mock()
+        commit.parents = [parent]
+        first = Mock()
+        first.diff = b"0123456789abcdef"
+        second = Mock()
+        second.diff = Mock()
+        second.diff.decode.side_effect = AssertionError("read past the cap")
+        parent.diff.return_value = iter([first, second])
+
+        # Act
+        result = extractor._get_commit_diff(commit)
+
+        # Assert
+        assert result == "0123456789\n" + GitExtractor.DIFF_TRUNCATED_MARKER
+
+    @patch("gitstory.parser.git_extractor.Repo")
+    def test_join_diff_keeps_text_within_cap(self, mock_repo_class):
+        """Test _join_diff() leaves diffs at or under the cap untouched."""
+        # Arrange
+        mock_repo_class.return_value = Mock()
+        extractor = GitExtractor("/fake/path", max_diff_chars=7)
+
+        # Act / Assert
+        assert extractor._join_diff(["abc", "def"]) == "abc\ndef"
+
+    @patch("gitstory.parser.git_extractor.Repo")
+    def test_join_diff_without_cap(self, mock_repo_class):
+        """Test _join_diff() keeps everything when max_diff_chars is None."""
+        # Arrange
+        mock_repo_class.return_value = Mock()
+        extractor = GitExtractor("/fake/path", max_diff_chars=None)
+
+        # Act / Assert
+        assert extractor._join_diff(["x" * 50000]) == "x" * 50000
+
+
 class TestBranchMethods:
     """Test suite for branch-related methods."""
 
@@ -689,6 +761,7 @@ class TestGetCommitsDiffErrorHandling:
         commit.parents[0].diff.side_effect = diff_side_effect
 
         mock_repo.iter_commits.return_value = [commit]
+        mock_repo.git.log.side_effect = GitCommandError("log", 128)
         mock_repo_class.return_value = mock_repo
 
         extractor = GitExtractor("/fake/path")
@@ -699,3 +772,282 @@ class TestGetCommitsDiffErrorHandling:
         # Assert
         assert len(result) == 1
         assert "Error extracting diff" in result[0]["diff"]
+
+
+class TestGetCommitChanges:
+    """Test suite for _get_commit_changes() method."""
+
+    @patch("gitstory.parser.git_extractor.Repo")
+    def test_get_commit_changes_single_diff(self, mock_repo_class):
+        """Test _get_commit_changes() diffs once and takes line counts from stats."""
+        # Arrange
+        mock_repo_class.return_value = Mock()
+        extractor = GitExtractor("/fake/path")
+
+        commit = Mock()
+        parent = Mock()
+        commit.parents = [parent]
+        commit.stats.total = {"insertions": 5, "deletions": 4}
+
+        diff_item1 = Mock()
+        diff_item1.a_path = "a.py"
+        diff_item1.diff = b"@@ -1,2 +1,2 @@\n-old\n+new\n context\n"
+        diff_item2 = Mock()
+        diff_item2.a_path = "b.py"
+        diff_item2.diff = b"@@ -0,0 +1,2 @@\n+one\n+two\n"
+        parent.diff.return_value = [diff_item1, diff_item2]
+
+        # Act
+        result = extractor._get_commit_changes(commit)
+
+        # Assert
+        parent.diff.assert_called_once_with(commit, create_patch=True)
+        assert result["files_changed"] == ["a.py", "b.py"]
+        assert result["insertions"] == 5
+        assert result["deletions"] == 4
+        assert "+new" in result["diff"] and "+two" in result["diff"]
+
+    @patch("gitstory.parser.git_extractor.Repo")
+    def test_get_commit_changes_initial_commit_uses_stats(self, mock_repo_class):
+        """Test _get_commit_changes() falls back to commit.stats for root commits."""
+        # Arrange
+        mock_repo_class.return_value = Mock()
+        extractor = GitExtractor("/fake/path")
+
+        commit = Mock()
+        commit.parents = []
+        commit.stats.total = {"insertions": 7, "deletions": 0}
+        tree_item = Mock()
+        tree_item.path = "README.md"
+        commit.tree.traverse.return_value = [tree_item]
+
+        # Act
+        result = extractor._get_commit_changes(commit)
+
+        # Assert
+        assert result["files_changed"] == []
+        assert result["insertions"] == 7
+        assert result["deletions"] == 0
+        assert result["diff"] == "A README.md"
+
+
+class TestGetChangesBatch:
+    """Test suite for batched change extraction via git log."""
+
+    LOG_OUTPUT = (
+        b"\x00\x01" + b"a" * 40 + b"\x00\n"
+        b"1\t1\ta.py\x00-\t-\timg.png\x00\x00"
+        b"diff --git a/a.py b/a.py\nindex 1..2 100644\n--- a/a.py\n+++ b/a.py\n"
+        b"@@ -1 +1 @@\n-old\n+new\n"
+        b"diff --git a/img.png b/img.png\nindex 3..4 100644\n"
+        b"Binary files a/img.png and b/img.png differ\n"
+        b"\x00\x01" + b"b" * 40 + b"\x00\n"
+        b"2\t0\t\x00old.py\x00new.py\x00\x00"
+        b"diff --git a/old.py b/new.py\nsimilarity index 90%\n"
+        b"rename from old.py\nrename to new.py\n"
+        b"@@ -1 +1,3 @@\n x\n+y\n+z"
+    )
+
+    @patch("gitstory.parser.git_extractor.Repo")
+    def test_parse_log_changes(self, mock_repo_class):
+        """Test _parse_log_changes() splits commits, numstat and hunks."""
+        # Arrange
+        mock_repo_class.return_value = Mock()
+        extractor = GitExtractor("/fake/path")
+
+        # Act
+        result = extractor._parse_log_changes(self.LOG_OUTPUT.decode())
+
+        # Assert
+        first = result["a" * 40]
+        assert first["files_changed"] == ["a.py", "img.png"]
+        assert first["insertions"] == 1
+        assert first["deletions"] == 1
+        assert first["diff"] == (
+            "@@ -1 +1 @@\n-old\n+new\n\n"
+            "Binary files a/img.png and b/img.png differ\n"
+        )
+        second = result["b" * 40]
+        assert second["files_changed"] == ["old.py"]
+        assert second["insertions"] == 2
+        assert second["diff"] == "@@ -1 +1,3 @@\n x\n+y\n+z\n"
+
+    @patch("gitstory.parser.git_extractor.Repo")
+    def test_get_commits_uses_batched_changes(self, mock_repo_class):
+        """Test get_commits() takes changes from git log instead of per-commit diffs."""
+        # Arrange
+        mock_repo = Mock()
+        mock_repo.active_branch.name = "main"
+        mock_repo.git.log.return_value = self.LOG_OUTPUT
+
+        commit = Mock()
+        commit.hexsha = "a" * 40
+        commit.author.name = "Test Author"
+        commit.author.email = "test@example.com"
+        commit.committed_date = datetime(2025, 1, 10, 10, 0).timestamp()
+        commit.message = "feat: batch"
+        commit.parents = [Mock()]
+
+        mock_repo.iter_commits.return_value = [commit]
+        mock_repo_class.return_value = mock_repo
+        extractor = GitExtractor("/fake/path")
+
+        # Act
+        result = extractor.get_commits()
+
+        # Assert
+        assert mock_repo.git.log.call_count == 2  # patch + rename-free counts
+        commit.parents[0].diff.assert_not_called()
+        assert result[0]["files_changed"] == ["a.py", "img.png"]
+        assert result[0]["insertions"] == 1
+
+    @patch("gitstory.parser.git_extractor.os.cpu_count", return_value=4)
+    @patch("gitstory.parser.git_extractor.Repo")
+    def test_get_changes_batch_runs_batches_in_parallel(
+        self, mock_repo_class, mock_cpu_count
+    ):
+        """Test _get_changes_batch() merges the results of every batch."""
+        # Arrange
+        mock_repo = Mock()
+        mock_repo_class.return_value = mock_repo
+        extractor = GitExtractor("/fake/path")
+        extractor.CHANGES_BATCH_SIZE = 1
+
+        def log_side_effect(*args, **kwargs):
+            return b"\x00\x01" + args[-1].encode() + b"\x00\n1\t0\tf.py\x00"
+
+        mock_repo.git.log.side_effect = log_side_effect
+        commits = [Mock(hexsha=char * 40) for char in "abc"]
+
+        # Act
+        result = extractor._get_changes_batch(commits)
+
+        # Assert
+        assert mock_repo.git.log.call_count == 6
+        assert sorted(result) == ["a" * 40, "b" * 40, "c" * 40]
+        assert result["b" * 40]["files_changed"] == ["f.py"]
+
+    @patch("gitstory.parser.git_extractor.Repo")
+    def test_format_commit_reuses_cached_commit(self, mock_repo_class):
+        """Test _format_commit() diffs a commit once and serves copies from cache."""
+        # Arrange
+        mock_repo_class.return_value = Mock()
+        extractor = GitExtractor("/fake/path")
+
+        commit = Mock()
+        commit.hexsha = "c" * 40
+        commit.committed_date = datetime(2025, 1, 10, 10, 0).timestamp()
+        commit.message = "fix: cache"
+        commit.parents = [Mock()]
+        commit.parents[0].diff.return_value = []
+
+        # Act
+        first = extractor._format_commit(commit)
+        second = extractor._format_commit(commit)
+
+        # Assert
+        assert second == first
+        assert second is not first
+        assert second["files_changed"] is not first["files_changed"]
+        commit.parents[0].diff.assert_called_once()
+
+    @patch("gitstory.parser.git_extractor.Repo")
+    def test_format_commit_keeps_committed_epoch(self, mock_repo_class):
+        """Test _format_commit() stores the raw commit epoch next to the ISO timestamp."""
+        # Arrange
+        mock_repo_class.return_value = Mock()
+        extractor = GitExtractor("/fake/path")
+
+        commit = Mock()
+        commit.hexsha = "d" * 40
+        commit.committed_date = 1736503200
+        commit.message = "docs: epoch"
+        commit.parents = []
+        commit.stats.total = {"insertions": 0, "deletions": 0}
+        commit.tree.traverse.return_value = []
+
+        # Act
+        result = extractor._format_commit(commit)
+
+        # Assert
+        assert result["committed_epoch"] == 1736503200
+        assert result["timestamp"] == datetime.fromtimestamp(1736503200).isoformat()
+
+
+class TestCommitCacheIsolation:
+    """Test suite for keeping cached commits safe from caller edits."""
+
+    def test_comparison_does_not_truncate_cached_messages(
+        self, git_repo, commit_files
+    ):
+        """Test a comparison's message truncation never leaks into later results."""
+        # Arrange
+        from gitstory.parser import RepoParser
+
+        long_message = "feat: " + "x" * 300
+        commit_files(long_message, {"base.py": "base\n"})
+        git_repo.git.branch("feature")
+        commit_files("fix: on main", {"main.py": "main\n"})
+        git_repo.git.checkout("feature")
+        commit_files("feat: on feature", {"feature.py": "feature\n"})
+        git_repo.git.checkout("main")
+        parser = RepoParser(git_repo.working_tree_dir)
+
+        # Act
+        comparison = parser.compare("main", "feature")
+        merge_base = parser.extractor.compare_branches("main", "feature")["merge_base"]
+        commits = parser.extractor.get_commits(branch="main")
+
+        # Assert
+        assert comparison["context_commits"][0]["message"].endswith("...")
+        assert comparison["merge_base"]["message"] == long_message
+        assert merge_base["message"] == long_message
+        assert commits[-1]["message"] == long_message
+
+
+class TestLineCountsMatchStats:
+    """Regression tests: insertions/deletions must match commit.stats."""
+
+    # Twelve unchanged lines keep the move above git's rename threshold
+    KEPT = "".join(f"keep {i}\n" for i in range(12))
+
+    def _rename_commit(self, commit_files):
+        commit_files(
+            "feat: add query",
+            {"query.sql": "-- header\nselect 1;\n++counter;\n" + self.KEPT},
+        )
+        return commit_files(
+            "refactor: move query",
+            {"db/query.sql": "--- header\nselect 2;\n+++counter;\n" + self.KEPT},
+            rename={"query.sql": "db/query.sql"},
+        )
+
+    def test_per_commit_changes_match_stats(self, git_repo, commit_files):
+        """Test _get_commit_changes() counts a rename and --/++ lines like stats."""
+        # Arrange
+        commit = self._rename_commit(commit_files)
+        extractor = GitExtractor(git_repo.working_tree_dir)
+
+        # Act
+        result = extractor._get_commit_changes(commit)
+
+        # Assert
+        assert result["files_changed"] == ["query.sql"]
+        assert result["insertions"] == commit.stats.total["insertions"] == 15
+        assert result["deletions"] == commit.stats.total["deletions"] == 15
+
+    def test_batched_changes_match_stats(self, git_repo, commit_files):
+        """Test get_commits() batches count a rename and --/++ lines like stats."""
+        # Arrange
+        commit = self._rename_commit(commit_files)
+        extractor = GitExtractor(git_repo.working_tree_dir)
+
+        # Act
+        result = extractor.get_commits(branch="main")[0]
+
+        # Assert
+        assert result["hash"] == commit.hexsha[:8]
+        assert result["files_changed"] == ["query.sql"]
+        assert result["insertions"] == commit.stats.total["insertions"] == 15
+        assert result["deletions"] == commit.stats.total["deletions"] == 15
+        assert "+++counter;" in result["diff"]
@@ -0,0 +1,253 @@
+"""
+Unit tests for the legacy GitPython RepoParser (gitstory.parser.repo_parser).
+
+These run against real temporary repositories built with the git_repo and
+commit_files fixtures, since the behaviour under test is how git diffs and
+resolves commits.
+"""
+
+import os
+from unittest.mock import patch
+
+import git
+
+from gitstory.parser.git_extractor import GitExtractor
+from gitstory.parser.repo_parser import RepoParser
+
+
+class TestFileChangesAgainstParent:
+    """Test suite for get_file_changes() on root, merge and rename commits."""
+
+    def test_root_commit_lists_every_file(self, git_repo, commit_files):
+        """Test get_file_changes() on a root commit diffs against the empty tree."""
+        # Arrange
+        root = commit_files("init", {"a.py": "a\n", "docs/b.md": "b\n"})
+        parser = RepoParser(git_repo.working_tree_dir)
+
+        # Act
+        result = parser.get_file_changes(root.hexsha)
+
+        # Assert
+        assert sorted(result) == ["a.py", "docs/b.md"]
+
+    def test_normal_commit_ignores_working_tree(self, git_repo, commit_files):
+        """Test get_file_changes() reports the commit itself, not uncommitted edits."""
+        # Arrange
+        commit_files("init", {"a.py": "a\n", "b.py": "b\n"})
+        second = commit_files("edit a", {"a.py": "a2\n"})
+        with open(f"{git_repo.working_tree_dir}/b.py", "w") as f:
+            f.write("uncommitted\n")
+        parser = RepoParser(git_repo.working_tree_dir)
+
+        # Act
+        result = parser.get_file_changes(second.hexsha)
+
+        # Assert
+        assert result == ["a.py"]
+
+    def test_merge_commit_diffs_against_first_parent(self, git_repo, commit_files):
+        """Test get_file_changes() on a merge lists what the merge brought in."""
+        # Arrange
+        commit_files("init", {"base.py": "base\n"})
+        git_repo.git.branch("feature")
+        commit_files("main work", {"main.py": "main\n"})
+        git_repo.git.checkout("feature")
+        commit_files("feature work", {"feature.py": "feature\n"})
+        git_repo.git.checkout("main")
+        git_repo.git.merge("feature", "--no-ff", "-m", "merge feature")
+        merge = git_repo.head.commit
+        parser = RepoParser(git_repo.working_tree_dir)
+
+        # Act
+        result = parser.get_file_changes(merge.hexsha)
+
+        # Assert
+        assert len(merge.parents) == 2
+        assert result == ["feature.py"]
+
+    def test_rename_reports_old_path_like_git_extractor(self, git_repo, commit_files):
+        """Test get_file_changes() and GitExtractor agree on renamed files."""
+        # Arrange
+        commit_files("init", {"old.py": "".join(f"line {i}\n" for i in range(10))})
+        renamed = commit_files("move", rename={"old.py": "pkg/new.py"})
+        parser = RepoParser(git_repo.working_tree_dir)
+        extractor = GitExtractor(git_repo.working_tree_dir)
+
+        # Act
+        result = parser.get_file_changes(renamed.hexsha)
+
+        # Assert
+        assert result == ["old.py"]
+        assert extractor._get_commit_changes(renamed)["files_changed"] == result
+        assert extractor.get_commits(branch="main")[0]["files_changed"] == result
+
+
+class TestStaticResolution:
+    """Test suite for RepoParser(static=...) revision resolution."""
+
+    def test_non_static_resolves_revisions_every_time(self, git_repo, commit_files):
+        """Test a default parser sees a branch move after the first lookup."""
+        # Arrange
+        first = commit_files("one", {"a.py": "1\n"})
+        parser = RepoParser(git_repo.working_tree_dir)
+        assert parser._resolve_commit(parser.repo, "main") == first
+        second = commit_files("two", {"a.py": "2\n"})
+
+        # Act
+        result = parser._resolve_commit(parser.repo, "main")
+
+        # Assert
+        assert result == second
+        assert parser._commit_cache == {}
+
+    def test_static_reuses_resolved_revisions(self, git_repo, commit_files):
+        """Test a static parser resolves each revision once and reuses it."""
+        # Arrange
+        first = commit_files("one", {"a.py": "1\n"})
+        parser = RepoParser(git_repo.working_tree_dir, static=True)
+        resolved = parser._resolve_commit(parser.repo, "main")
+        commit_files("two", {"a.py": "2\n"})
+
+        # Act
+        result = parser._resolve_commit(parser.repo, "main")
+
+        # Assert
+        assert resolved == first
+        assert result is resolved
+        assert parser.get_file_changes("main") == ["a.py"]
+
+    def test_static_does_not_cache_other_repos(self, git_repo, commit_files):
+        """Test commits resolved through another Repo object are never cached."""
+        # Arrange
+        commit_files("one", {"a.py": "1\n"})
+        parser = RepoParser(git_repo.working_tree_dir, static=True)
+        other = git.Repo(git_repo.working_tree_dir)
+
+        # Act
+        result = parser._resolve_commit(other, "main")
+
+        # Assert
+        assert result.repo is other
+        assert parser._commit_cache == {}
+        other.close()
+
+
+class TestFileChangesCache:
+    """Test suite for the per-commit file changes cache and git environment."""
+
+    def test_cache_hit_skips_the_diff(self, git_repo, commit_files):
+        """Test a repeated lookup is served from the cache without diffing."""
+        # Arrange
+        commit_files("init", {"a.py": "a\n"})
+        second = commit_files("edit", {"a.py": "a2\n", "b.py": "b\n"})
+        parser = RepoParser(git_repo.working_tree_dir)
+        first_result = parser.get_file_changes(second.hexsha)
+
+        # Act
+        with patch.object(git.Commit, "diff", side_effect=AssertionError("diffed")):
+            cached_result = parser.get_file_changes(second.hexsha)
+
+        # Assert
+        assert sorted(cached_result) == ["a.py", "b.py"]
+        assert cached_result == first_result
+        assert list(parser._file_changes_cache) == [second.hexsha]
+
+    def test_cache_does_not_leak_between_commits(self, git_repo, commit_files):
+        """Test each commit gets its own entry and callers can't edit the cache."""
+        # Arrange
+        first = commit_files("one", {"a.py": "a\n"})
+        parser = RepoParser(git_repo.working_tree_dir)
+        by_branch = parser.get_file_changes("main")
+        by_branch.append("edited-by-caller.py")
+        second = commit_files("two", {"b.py": "b\n"})
+
+        # Act
+        moved_branch = parser.get_file_changes("main")
+        first_again = parser.get_file_changes(first.hexsha)
+
+        # Assert
+        assert moved_branch == ["b.py"]
+        assert first_again == ["a.py"]
+        assert set(parser._file_changes_cache) == {first.hexsha, second.hexsha}
+
+    def test_skips_system_gitattributes_for_this_repo_only(
+        self, git_repo, commit_files, monkeypatch
+    ):
+        """Test GIT_ATTR_NOSYSTEM is set on the parser's git commands, not globally."""
+        # Arrange
+        monkeypatch.delenv("GIT_ATTR_NOSYSTEM", raising=False)
+        root = commit_files("init", {"a.py": "a\n"})
+
+        # Act
+        parser = RepoParser(git_repo.working_tree_dir)
+
+        # Assert
+        assert parser.repo.git.environment()["GIT_ATTR_NOSYSTEM"] == "1"
+        assert "GIT_ATTR_NOSYSTEM" not in os.environ
+        assert parser.get_file_changes(root.hexsha) == ["a.py"]
+
+
+class TestFileChangesBulk:
+    """Test suite for get_file_changes_bulk() on a real repository."""
+
+    def _build_history(self, git_repo, commit_files):
+        """Root commit, a rename, ten edits and a merge.
+
+        Returns every hexsha plus the root, rename and merge hexshas.
+        """
+        root = commit_files("init", {"base.py": "".join(f"{i}\n" for i in range(10))})
+        git_repo.git.branch("feature")
+        rename = commit_files("move", rename={"base.py": "src/base.py"})
+        for i in range(10):
+            commit_files(f"edit {i}", {f"file{i}.py": f"{i}\n"})
+        git_repo.git.checkout("feature")
+        commit_files("feature work", {"feature.py": "feature\n"})
+        git_repo.git.checkout("main")
+        git_repo.git.merge("feature", "--no-ff", "-m", "merge feature")
+        hexshas = [commit.hexsha for commit in git_repo.iter_commits("main")]
+        return hexshas, root.hexsha, rename.hexsha, git_repo.head.commit.hexsha
+
+    @patch("gitstory.parser.repo_parser.os.cpu_count", return_value=4)
+    def test_bulk_matches_single_lookups_in_input_order(
+        self, mock_cpu_count, git_repo, commit_files
+    ):
+        """Test bulk results cover every commit in input order, like single lookups."""
+        # Arrange
+        history, root, rename, merge = self._build_history(git_repo, commit_files)
+        hexshas = history[::2] + history[1::2]  # not history order
+        expected = {
+            hexsha: RepoParser(git_repo.working_tree_dir).get_file_changes(hexsha)
+            for hexsha in hexshas
+        }
+        parser = RepoParser(git_repo.working_tree_dir)
+
+        # Act
+        result = parser.get_file_changes_bulk(hexshas)
+
+        # Assert
+        assert list(result) == hexshas
+        assert result == expected
+        assert result[root] == ["base.py"]
+        assert result[rename] == ["base.py"]
+        assert result[merge] == ["feature.py"]
+
+    @patch("gitstory.parser.repo_parser.os.cpu_count", return_value=4)
+    def test_concurrent_cache_writes_stay_consistent(
+        self, mock_cpu_count, git_repo, commit_files
+    ):
+        """Test workers racing on the shared cache leave one correct entry each."""
+        # Arrange
+        hexshas = self._build_history(git_repo, commit_files)[0]
+        expected = {
+            hexsha: RepoParser(git_repo.working_tree_dir).get_file_changes(hexsha)
+            for hexsha in hexshas
+        }
+        parser = RepoParser(git_repo.working_tree_dir)
+
+        # Act: every commit requested several times so workers race on each key
+        result = parser.get_file_changes_bulk(hexshas * 4)
+
+        # Assert
+        assert result == expected
+        assert parser._file_changes_cache == expected
+        assert parser.get_file_changes_bulk(hexshas) == expected
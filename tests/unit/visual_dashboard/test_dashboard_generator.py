@@ -16,9 +16,16 @@ Coverage Target: 95%+ for this module
 import os
 import pytest
 from unittest.mock import Mock, patch, mock_open
+from gitstory.visual_dashboard import dashboard_generator
 from gitstory.visual_dashboard.dashboard_generator import generate_dashboard
 
 
+@pytest.fixture(autouse=True)
+def reset_template_cache(monkeypatch):
+    """Drop the cached template so each test sees its own mock."""
+    monkeypatch.setattr(dashboard_generator, "_dashboard_template", None)
+
+
 class TestDashboardGenerationSuccess:
     """Test suite for successful dashboard generation scenarios."""
 
@@ -73,7 +80,6 @@ class TestDashboardGenerationSuccess:
         """Test successful dashboard generation creates output directory."""
         # Arrange
         mock_template = Mock()
-        mock_template.render.return_value = "<html>Dashboard</html>"
         mock_get_template.return_value = mock_template
         mock_markdown.return_value = "<h1>Summary</h1>"
 
@@ -112,7 +118,6 @@ class TestDashboardGenerationSuccess:
         """Test dashboard generation loads correct template."""
         # Arrange
         mock_template = Mock()
-        mock_template.render.return_value = "<html>Dashboard</html>"
         mock_get_template.return_value = mock_template
         mock_markdown.return_value = "<h1>Summary</h1>"
 
@@ -145,7 +150,6 @@ class TestDashboardGenerationSuccess:
         """Test markdown summary is converted to HTML."""
         # Arrange
         mock_template = Mock()
-        mock_template.render.return_value = "<html>Dashboard</html>"
         mock_get_template.return_value = mock_template
         mock_markdown.return_value = "<h1>Summary</h1><p>This is a summary.</p>"
 
@@ -177,10 +181,9 @@ class TestDashboardGenerationSuccess:
         sample_repo_data,
         sample_ai_summary,
     ):
-        """Test template is rendered with correct data."""
+        """Test template is streamed with correct data."""
         # Arrange
         mock_template = Mock()
-        mock_template.render.return_value = "<html>Dashboard</html>"
         mock_get_template.return_value = mock_template
         mock_markdown.return_value = "<h1>Summary</h1>"
 
@@ -188,8 +191,8 @@ class TestDashboardGenerationSuccess:
         generate_dashboard(sample_repo_data, sample_ai_summary, "/test/repo")
 
         # Assert
-        mock_template.render.assert_called_once()
-        call_kwargs = mock_template.render.call_args[1]
+        mock_template.stream.assert_called_once()
+        call_kwargs = mock_template.stream.call_args[1]
 
         assert call_kwargs["commits"] == sample_repo_data["commits"]
         assert call_kwargs["stats"] == sample_repo_data["stats"]
@@ -219,7 +222,6 @@ class TestDashboardGenerationSuccess:
         """Test HTML content is written to file."""
         # Arrange
         mock_template = Mock()
-        mock_template.render.return_value = "<html>Dashboard Content</html>"
         mock_get_template.return_value = mock_template
         mock_markdown.return_value = "<h1>Summary</h1>"
 
@@ -237,8 +239,9 @@ class TestDashboardGenerationSuccess:
             and "output" in actual_path
             and "dashboard.html" in actual_path
         )
-        assert mock_file.call_args[0][1] == "w"
-        mock_file().write.assert_called_once_with("<html>Dashboard Content</html>")
+        assert mock_file.call_args[0][1] == "wb"
+        mock_stream = mock_template.stream.return_value
+        mock_stream.dump.assert_called_once_with(mock_file(), encoding="utf-8")
 
     @patch("gitstory.visual_dashboard.dashboard_generator.markdown.markdown")
     @patch("gitstory.visual_dashboard.dashboard_generator.env.get_template")
@@ -263,7 +266,6 @@ class TestDashboardGenerationSuccess:
         """Test success message is printed."""
         # Arrange
         mock_template = Mock()
-        mock_template.render.return_value = "<html>Dashboard</html>"
         mock_get_template.return_value = mock_template
         mock_markdown.return_value = "<h1>Summary</h1>"
 
@@ -301,7 +303,6 @@ class TestDashboardGenerationSuccess:
         """Test custom output filename is used."""
         # Arrange
         mock_template = Mock()
-        mock_template.render.return_value = "<html>Dashboard</html>"
         mock_get_template.return_value = mock_template
         mock_markdown.return_value = "<h1>Summary</h1>"
 
@@ -321,7 +322,7 @@ class TestDashboardGenerationSuccess:
             and "output" in actual_call
             and "custom_dashboard.html" in actual_call
         )
-        assert mock_file.call_args[0][1] == "w"
+        assert mock_file.call_args[0][1] == "wb"
 
     @patch("gitstory.visual_dashboard.dashboard_generator.markdown.markdown")
     @patch("gitstory.visual_dashboard.dashboard_generator.env.get_template")
@@ -346,7 +347,6 @@ class TestDashboardGenerationSuccess:
         """Test CSS and JS files are copied to output directory."""
         # Arrange
         mock_template = Mock()
-        mock_template.render.return_value = "<html>Dashboard</html>"
         mock_get_template.return_value = mock_template
         mock_markdown.return_value = "<h1>Summary</h1>"
 
@@ -404,7 +404,6 @@ class TestDataHandling:
         ai_summary = {"summary": "Empty summary", "metadata": {}}
 
         mock_template = Mock()
-        mock_template.render.return_value = "<html>Empty</html>"
         mock_get_template.return_value = mock_template
         mock_markdown.return_value = "<p>Empty summary</p>"
 
@@ -412,7 +411,7 @@ class TestDataHandling:
         generate_dashboard(repo_data, ai_summary, "/test/repo")
 
         # Assert
-        call_kwargs = mock_template.render.call_args[1]
+        call_kwargs = mock_template.stream.call_args[1]
         assert call_kwargs["commits"] == []
 
     @patch("gitstory.visual_dashboard.dashboard_generator.markdown.markdown")
@@ -439,7 +438,6 @@ class TestDataHandling:
         ai_summary = {"summary": "Summary", "metadata": {}}
 
         mock_template = Mock()
-        mock_template.render.return_value = "<html>Dashboard</html>"
         mock_get_template.return_value = mock_template
         mock_markdown.return_value = "<p>Summary</p>"
 
@@ -447,7 +445,7 @@ class TestDataHandling:
         generate_dashboard(repo_data, ai_summary, "/test/repo")
 
         # Assert
-        call_kwargs = mock_template.render.call_args[1]
+        call_kwargs = mock_template.stream.call_args[1]
         assert call_kwargs["commits"] == []  # Default from .get()
 
     @patch("gitstory.visual_dashboard.dashboard_generator.markdown.markdown")
@@ -474,7 +472,6 @@ class TestDataHandling:
         ai_summary = {"summary": "Summary", "metadata": {}}
 
         mock_template = Mock()
-        mock_template.render.return_value = "<html>Dashboard</html>"
         mock_get_template.return_value = mock_template
         mock_markdown.return_value = "<p>Summary</p>"
 
@@ -482,7 +479,7 @@ class TestDataHandling:
         generate_dashboard(repo_data, ai_summary, "/test/repo")
 
         # Assert
-        call_kwargs = mock_template.render.call_args[1]
+        call_kwargs = mock_template.stream.call_args[1]
         assert call_kwargs["stats"] == {}  # Default from .get()
 
     @patch("gitstory.visual_dashboard.dashboard_generator.markdown.markdown")
@@ -509,7 +506,6 @@ class TestDataHandling:
         ai_summary = {"metadata": {}}  # No 'summary' key
 
         mock_template = Mock()
-        mock_template.render.return_value = "<html>Dashboard</html>"
         mock_get_template.return_value = mock_template
         mock_markdown.return_value = ""  # Empty string from markdown conversion
 
@@ -518,7 +514,7 @@ class TestDataHandling:
 
         # Assert
         mock_markdown.assert_called_once_with("")  # Default from .get()
-        call_kwargs = mock_template.render.call_args[1]
+        call_kwargs = mock_template.stream.call_args[1]
         assert call_kwargs["ai_summary"]["summary"] == ""
 
     @patch("gitstory.visual_dashboard.dashboard_generator.markdown.markdown")
@@ -545,7 +541,6 @@ class TestDataHandling:
         ai_summary = {"summary": "Test"}  # No 'metadata' key
 
         mock_template = Mock()
-        mock_template.render.return_value = "<html>Dashboard</html>"
         mock_get_template.return_value = mock_template
         mock_markdown.return_value = "<p>Test</p>"
 
@@ -553,7 +548,7 @@ class TestDataHandling:
         generate_dashboard(repo_data, ai_summary, "/test/repo")
 
         # Assert
-        call_kwargs = mock_template.render.call_args[1]
+        call_kwargs = mock_template.stream.call_args[1]
         assert call_kwargs["ai_summary"]["metadata"] == {}  # Default from .get()
 
     @patch("gitstory.visual_dashboard.dashboard_generator.markdown.markdown")
@@ -588,7 +583,6 @@ class TestDataHandling:
         ai_summary = {"summary": "Summary" * 1000, "metadata": {}}  # Long summary
 
         mock_template = Mock()
-        mock_template.render.return_value = "<html>Large Dashboard</html>"
         mock_get_template.return_value = mock_template
         mock_markdown.return_value = "<p>Long HTML</p>"
 
@@ -596,7 +590,7 @@ class TestDataHandling:
         generate_dashboard(repo_data, ai_summary, "/test/repo")
 
         # Assert
-        call_kwargs = mock_template.render.call_args[1]
+        call_kwargs = mock_template.stream.call_args[1]
         assert len(call_kwargs["commits"]) == 100
 
 
@@ -627,7 +621,6 @@ class TestFileSystemOperations:
         ai_summary = {"summary": "Test", "metadata": {}}
 
         mock_template = Mock()
-        mock_template.render.return_value = "<html>Dashboard</html>"
         mock_get_template.return_value = mock_template
         mock_markdown.return_value = "<p>Test</p>"
 
@@ -659,13 +652,12 @@ class TestFileSystemOperations:
         mock_get_template,
         mock_markdown,
     ):
-        """Test file is opened in write mode ('w')."""
+        """Test file is opened in binary write mode ('wb')."""
         # Arrange
         repo_data = {"commits": [], "stats": {}}
         ai_summary = {"summary": "Test", "metadata": {}}
 
         mock_template = Mock()
-        mock_template.render.return_value = "<html>Dashboard</html>"
         mock_get_template.return_value = mock_template
         mock_markdown.return_value = "<p>Test</p>"
 
@@ -681,7 +673,7 @@ class TestFileSystemOperations:
             and "output" in actual_path
             and "dashboard.html" in actual_path
         )
-        assert mock_file.call_args[0][1] == "w"
+        assert mock_file.call_args[0][1] == "wb"
 
     @patch("gitstory.visual_dashboard.dashboard_generator.markdown.markdown")
     @patch("gitstory.visual_dashboard.dashboard_generator.env.get_template")
@@ -700,7 +692,6 @@ class TestFileSystemOperations:
         ai_summary = {"summary": "Test", "metadata": {}}
 
         mock_template = Mock()
-        mock_template.render.return_value = "<html>Dashboard</html>"
         mock_get_template.return_value = mock_template
         mock_markdown.return_value = "<p>Test</p>"
 
@@ -748,7 +739,6 @@ class TestSpecialCharacterHandling:
         ai_summary = {"summary": "Unicode test: 你好世界", "metadata": {}}
 
         mock_template = Mock()
-        mock_template.render.return_value = "<html>Unicode Dashboard</html>"
         mock_get_template.return_value = mock_template
         mock_markdown.return_value = "<p>Unicode test</p>"
 
@@ -756,6 +746,68 @@ class TestSpecialCharacterHandling:
         generate_dashboard(repo_data, ai_summary, "/test/repo")
 
         # Assert
-        call_kwargs = mock_template.render.call_args[1]
+        call_kwargs = mock_template.stream.call_args[1]
         assert call_kwargs["commits"][0]["author"] == "José García"
         assert "☕" in call_kwargs["commits"][0]["message"]
+
+
+class TestTemplateCaching:
+    """Test suite for the module-level template cache."""
+
+    @patch("gitstory.visual_dashboard.dashboard_generator.env.get_template")
+    def test_template_loaded_once(self, mock_get_template):
+        """Test the template is fetched from the environment only once."""
+        mock_get_template.return_value = Mock()
+
+        first = dashboard_generator._get_template()
+        second = dashboard_generator._get_template()
+
+        assert first is second
+        mock_get_template.assert_called_once_with("dashboard_template.html")
+
+    def test_real_template_loads(self):
+        """Test the shipped template compiles."""
+        template = dashboard_generator._get_template()
+
+        assert template.name == "dashboard_template.html"
+
+    @patch("builtins.print")
+    def test_streams_real_template_to_disk(self, mock_print, tmp_path):
+        """Test the real template is streamed into a complete HTML file."""
+        repo_data = {
+            "commits": [],
+            "stats": {"total_commits": 0, "by_type": {}, "by_author": {}},
+        }
+        ai_summary = {"summary": "Streamed **summary**", "metadata": {}}
+
+        generate_dashboard(repo_data, ai_summary, str(tmp_path))
+
+        html = (tmp_path / "output" / "dashboard.html").read_text(encoding="utf-8")
+        assert "<strong>summary</strong>" in html
+        assert html.rstrip().endswith("</html>")
+
+    @patch("builtins.print")
+    def test_escapes_git_data_but_not_summary(self, mock_print, tmp_path):
+        """Test commit fields are HTML-escaped while the rendered summary is not."""
+        repo_data = {
+            "commits": [
+                {
+                    "hash": "abc123",
+                    "author": "Mallory <m@example.com>",
+                    "timestamp": "2024-01-01T00:00:00",
+                    "message": "<script>alert(1)</script>",
+                    "type": "feature",
+                    "files_changed": 1,
+                    "changes": 2,
+                }
+            ],
+            "stats": {"total_commits": 1, "by_type": {}, "by_author": {}},
+        }
+        ai_summary = {"summary": "Plain **bold**", "metadata": {}}
+
+        generate_dashboard(repo_data, ai_summary, str(tmp_path))
+
+        html = (tmp_path / "output" / "dashboard.html").read_text(encoding="utf-8")
+        assert "<td>&lt;script&gt;alert(1)&lt;/script&gt;</td>" in html
+        assert "<td>Mallory &lt;m@example.com&gt;</td>" in html
+        assert "<strong>bold</strong>" in html